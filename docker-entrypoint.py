@@ -31,7 +31,7 @@ USAGE:
     # Or manually: python docker-entrypoint.py [command]
 
     # With custom PUID/PGID:
-    PUID=1000 PGID=1000 python docker-entrypoint.py python -m uvicorn main:app
+    PUID=1000 PGID=1000 python docker-entrypoint.py python main.py
 """
 
 import grp
@@ -62,16 +62,9 @@ WRITABLE_DIRECTORIES = [
     "/app/data",
 ]
 
-DEFAULT_COMMAND = [
-    "python",
-    "-m",
-    "uvicorn",
-    "main:app",
-    "--host",
-    "0.0.0.0",
-    "--port",
-    "30887",
-]
+# main.py starts uvicorn from config (ASH_HOST, ASH_PORT, ASH_WORKERS) on
+# uvloop + httptools, so server.workers takes effect in the container
+DEFAULT_COMMAND = ["python", "main.py"]
 
 __version__ = "v5.0-6-1.0-1"
 
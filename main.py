@@ -22,49 +22,207 @@ Repository: https://github.com/the-alphabet-cartel/ash
 """
 
 import asyncio
-from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from typing import AsyncGenerator, Optional
+import logging
+import os
+import random
+import tempfile
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, AsyncGenerator, Iterator, IO, Optional, Protocol
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from src.managers.config_manager import create_config_manager
+from src.managers.config_manager import ConfigManager, create_config_manager
 from src.managers.logging_config_manager import create_logging_config_manager
 from src.managers.ecosystem.ecosystem_health_manager import (
+    EcosystemHealth,
     EcosystemHealthManager,
     create_ecosystem_health_manager,
-)
-from src.managers.alerting import (
-    AlertManager,
-    create_alert_manager,
-    create_discord_webhook_sender,
-    DiscordWebhookSender,
-)
-from src.managers.metrics import (
-    MetricsManager,
-    create_metrics_manager,
+    create_health_check_client,
 )
 from src.api.routes.health import router as health_router
 from src.api.routes.metrics import router as metrics_router
 
+# Alerting and metrics are imported lazily in lifespan() so deployments with
+# those features disabled never pay their import cost
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from src.managers.alerting import AlertManager, DiscordWebhookSender
+    from src.managers.metrics import MetricsManager
+
+# uvloop and httptools are optional at import time so the app still runs on
+# platforms without them (e.g. Windows development); uvicorn[standard]
+# installs both.
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - platform dependent
+    uvloop = None
+
+try:
+    import httptools  # noqa: F401 - only probed so uvicorn can be told to use it
+except ImportError:  # pragma: no cover - platform dependent
+    httptools = None
+
+# fcntl (background leader lock) is POSIX-only; without it the process is
+# treated as the single worker and always runs the background loops
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None
+
+# Prometheus instrumentation is optional too: without the package the API
+# simply runs without the /prometheus endpoint
+try:
+    from prometheus_fastapi_instrumentator import Instrumentator
+except ImportError:  # pragma: no cover - optional dependency
+    Instrumentator = None
+
 
 # =============================================================================
 # Application Version
 # =============================================================================
 __version__ = "5.0.2"
 
+# Log banners are built once; each is emitted as a single record so the
+# handler lock is taken once per banner instead of once per line
+_BANNER = "=" * 70
+_STARTUP_BANNER = f"{_BANNER}\n🌳 Ash Ecosystem Health API - Starting Up\n{_BANNER}"
+_SHUTDOWN_BANNER = f"{_BANNER}\n🛑 Ash Ecosystem Health API - Shutting Down\n{_BANNER}"
+
+# CORS: headers Ash-Dash actually sends, and how long browsers may cache preflights
+CORS_ALLOWED_HEADERS = ["Accept", "Authorization", "Content-Type"]
+CORS_MAX_AGE_SECONDS = 86400
+
+# Prometheus exposition path (/metrics is already the historical metrics API)
+# and the handlers (anchored regexes) left out of the latency histograms:
+# probes and scrapes would swamp them
+PROMETHEUS_PATH = "/prometheus"
+PROMETHEUS_EXCLUDED_HANDLERS = [
+    f"^{PROMETHEUS_PATH}$",
+    "^/health$",
+    "^/healthz$",
+    "^/health/ready$",
+    "^/readyz$",
+]
+
+# Longest single sleep while waiting for the maintenance window; the wall clock
+# is re-read after each chunk so suspend/resume or clock steps can't skew it
+MAINTENANCE_MAX_SLEEP_SECONDS = 900
+
+# Retry backoff after a failed maintenance run (doubles up to the maximum)
+MAINTENANCE_RETRY_INITIAL_SECONDS = 60
+MAINTENANCE_RETRY_MAX_SECONDS = 3600
+
+# Lock file used to elect the single worker that runs background loops
+BACKGROUND_LOCK_PATH = os.path.join(tempfile.gettempdir(), "ash-background.lock")
+
+
+# =============================================================================
+# Logger Protocol and Null Logger (default for background loops)
+# =============================================================================
+class _LoggerLike(Protocol):
+    """Anything that hands out named loggers (e.g. LoggingConfigManager)."""
+
+    def get_logger(self, name: str) -> logging.Logger: ...
+
+
+class _NullLoggerManager:
+    """
+    Logger manager whose loggers discard everything.
+
+    Used as the default for background loops so they can call log methods
+    unconditionally instead of checking for a missing logger; disabled
+    levels are short-circuited by ``Logger.isEnabledFor``.
+    """
+
+    def get_logger(self, name: str) -> logging.Logger:
+        """
+        Get a logger that never emits.
+
+        Args:
+            name: Logger name suffix
+
+        Returns:
+            Logger with a NullHandler, above CRITICAL and not propagating
+        """
+        null_log = logging.getLogger(f"ash_null.{name}")
+        if not null_log.handlers:
+            null_log.addHandler(logging.NullHandler())
+            null_log.setLevel(logging.CRITICAL + 1)
+            null_log.propagate = False
+        return null_log
+
+
+_NULL_LOGGER = _NullLoggerManager()
+
+
+# =============================================================================
+# Background Task Leader Election
+# =============================================================================
+def acquire_background_leader(lock_path: str = BACKGROUND_LOCK_PATH) -> Optional[IO]:
+    """
+    Try to become the worker responsible for background loops.
+
+    When running with multiple workers, every worker executes the lifespan,
+    but the health check and maintenance loops must only run once or alerts
+    and snapshots would be duplicated per worker. The first worker to take a
+    non-blocking exclusive lock wins; the lock is released when the returned
+    file is closed (or the process exits).
+
+    Args:
+        lock_path: Path of the lock file shared by all workers
+
+    Returns:
+        Open lock file if this worker is the leader, None otherwise
+        (always the leader where fcntl is unavailable, e.g. Windows)
+    """
+    lock_file = open(lock_path, "a")
+    if fcntl is None:
+        return lock_file
+
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
 
 # =============================================================================
 # Background Health Check Loop
 # =============================================================================
+async def record_health_metrics(
+    metrics_manager: "MetricsManager",
+    health: EcosystemHealth,
+) -> None:
+    """
+    Store a snapshot and record incidents for one health check.
+
+    Runs as its own task so metrics persistence overlaps with alerting.
+    The snapshot is stored before incidents are detected, as before.
+
+    Args:
+        metrics_manager: MetricsManager instance
+        health: EcosystemHealth from the health check
+    """
+    # Store snapshot (always)
+    await metrics_manager.store_snapshot(health)
+
+    # Detect and record incidents (always, regardless of alert config)
+    # This is INDEPENDENT of AlertManager - ensures complete audit trail
+    await metrics_manager.detect_and_record_incidents(health)
+
+
 async def health_check_loop(
     health_manager: EcosystemHealthManager,
-    alert_manager: AlertManager,
-    webhook_sender: DiscordWebhookSender,
-    metrics_manager: Optional[MetricsManager] = None,
+    alert_manager: Optional["AlertManager"] = None,
+    webhook_sender: Optional["DiscordWebhookSender"] = None,
+    metrics_manager: Optional["MetricsManager"] = None,
     interval_seconds: int = 60,
-    logger: Optional[object] = None,
+    logger: _LoggerLike = _NULL_LOGGER,
+    stop_event: Optional[asyncio.Event] = None,
 ) -> None:
     """
     Background task that periodically checks ecosystem health, stores metrics,
@@ -76,133 +234,186 @@ async def health_check_loop(
         3. Stores snapshots and detects incidents (metrics - independent of alerting)
         4. Detects status transitions and sends alerts
 
+    Alerting and metrics are each optional; the loop is only started when at
+    least one of them is active.
+
     Args:
         health_manager: EcosystemHealthManager instance
-        alert_manager: AlertManager instance
-        webhook_sender: DiscordWebhookSender instance
+        alert_manager: Optional AlertManager (None = alerting disabled)
+        webhook_sender: Optional DiscordWebhookSender (None = alerting disabled)
         metrics_manager: Optional MetricsManager for historical tracking
         interval_seconds: Seconds between health checks
-        logger: Optional logger instance
+        logger: Logger manager (defaults to a null logger)
+        stop_event: Optional event that ends the loop cleanly once set; the
+            loop waits on it between ticks instead of sleeping
     """
-    log = logger.get_logger("health_loop") if logger else None
+    log = logger.get_logger("health_loop")
 
-    def log_info(msg: str) -> None:
-        if log:
-            log.info(msg)
+    if stop_event is None:
+        stop_event = asyncio.Event()
 
-    def log_warning(msg: str) -> None:
-        if log:
-            log.warning(msg)
-
-    def log_error(msg: str) -> None:
-        if log:
-            log.error(msg)
+    async def wait_for_stop(timeout: float) -> bool:
+        """Wait up to timeout seconds; return True if a stop was requested."""
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        return stop_event.is_set()
 
-    def log_debug(msg: str) -> None:
-        if log:
-            log.debug(msg)
+    alerting_enabled = alert_manager is not None and webhook_sender is not None
 
-    log_info("🔄 Starting health check loop...")
+    log.info("🔄 Starting health check loop...")
 
     # =========================================================================
     # Initial Health Check (Establish Baseline)
     # =========================================================================
     try:
-        log_info("📋 Performing initial health check to establish baseline...")
+        log.info("📋 Performing initial health check to establish baseline...")
         initial_health = await health_manager.check_ecosystem_health()
-        alert_manager.set_initial_state(initial_health)
-        log_info(f"✅ Baseline established: ecosystem={initial_health.status.value}")
+        if alerting_enabled:
+            alert_manager.set_initial_state(initial_health)
+        log.info("✅ Baseline established: ecosystem=%s", initial_health.status.value)
 
         # Store initial snapshot if metrics enabled
         if metrics_manager:
             await metrics_manager.store_snapshot(initial_health)
-            log_debug("📊 Initial snapshot stored")
+            log.debug("📊 Initial snapshot stored")
 
     except Exception as e:
-        log_error(f"❌ Failed to establish initial state: {e}")
+        log.error("❌ Failed to establish initial state: %s", e)
         # Continue anyway - will try again on next iteration
-        await asyncio.sleep(interval_seconds)
+        if await wait_for_stop(interval_seconds):
+            log.info("🛑 Health check loop stopped")
+            return
 
     # =========================================================================
     # Main Loop
     # =========================================================================
+    # Ticks are scheduled against the monotonic loop clock so the period stays
+    # at interval_seconds regardless of how long each health check takes
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time() + interval_seconds
+
+    # Bind hot-path callables once instead of resolving attributes every tick
+    loop_time = loop.time
+    check_health = health_manager.check_ecosystem_health
+    if alerting_enabled:
+        detect_transitions = alert_manager.detect_transitions
+        should_alert = alert_manager.should_alert
+        record_alert_sent = alert_manager.record_alert_sent
+        release_alert = alert_manager.release_alert
+        send_alerts = webhook_sender.send_alerts
+
     while True:
+        # Wait until the next scheduled tick (or until shutdown is requested)
+        if await wait_for_stop(max(0.0, next_tick - loop_time())):
+            break
+
         try:
-            # Wait for the configured interval
-            await asyncio.sleep(interval_seconds)
+            # Advance the deadline; if a check overran, skip the missed ticks
+            # instead of bursting to catch up
+            next_tick += interval_seconds
+            now = loop_time()
+            while next_tick <= now:
+                next_tick += interval_seconds
 
-            log_debug(f"🔍 Running periodic health check...")
+            log.debug("🔍 Running periodic health check...")
 
             # Check ecosystem health
-            current_health = await health_manager.check_ecosystem_health()
+            current_health = await check_health()
 
             # =================================================================
             # METRICS (Phase 5 - Independent of Alerting)
             # =================================================================
+            # Recorded in the background so DB writes don't delay alerting
+            metrics_task: Optional[asyncio.Task] = None
             if metrics_manager:
-                try:
-                    # Store snapshot (always)
-                    await metrics_manager.store_snapshot(current_health)
-
-                    # Detect and record incidents (always, regardless of alert config)
-                    # This is INDEPENDENT of AlertManager - ensures complete audit trail
-                    await metrics_manager.detect_and_record_incidents(current_health)
-
-                except Exception as e:
-                    log_warning(f"⚠️ Metrics recording error: {e}")
-                    # Continue with alerting - don't let metrics failures block alerts
+                metrics_task = asyncio.create_task(
+                    record_health_metrics(metrics_manager, current_health),
+                    name="record_health_metrics",
+                )
 
-            # =================================================================
-            # ALERTING (Existing - Respects alert config)
-            # =================================================================
-            transitions = alert_manager.detect_transitions(current_health)
-
-            if not transitions:
-                log_debug("✅ No status transitions detected")
-                continue
-
-            # Process each transition
-            alerts_sent = 0
-            for transition in transitions:
-                # Check cooldown
-                if not alert_manager.should_alert(transition):
-                    log_debug(f"⏳ Skipping alert for {transition.entity_name} (cooldown)")
+            try:
+                # =============================================================
+                # ALERTING (Existing - Respects alert config)
+                # =============================================================
+                if not alerting_enabled:
                     continue
 
-                # Send alert
-                log_info(
-                    f"🔔 Sending alert: {transition.entity_name} "
-                    f"{transition.from_status.value} → {transition.to_status.value}"
-                )
-
-                success = await webhook_sender.send_alert(transition)
+                transitions = detect_transitions(current_health)
 
-                if success:
-                    alert_manager.record_alert_sent(transition)
-                    alerts_sent += 1
-                else:
-                    log_warning(f"⚠️ Failed to send alert for {transition.entity_name}")
+                if not transitions:
+                    log.debug("✅ No status transitions detected")
+                    continue
 
-            if alerts_sent > 0:
-                log_info(f"✅ Sent {alerts_sent} alert(s)")
+                # Filter out transitions still in cooldown
+                to_send = []
+                for transition in transitions:
+                    if not await should_alert(transition):
+                        log.debug("⏳ Skipping alert for %s (cooldown)", transition.entity_name)
+                        continue
+
+                    log.info(
+                        "🔔 Sending alert: %s %s → %s",
+                        transition.entity_name,
+                        transition.from_status.value,
+                        transition.to_status.value,
+                    )
+                    to_send.append(transition)
+
+                # Queue all alerts at once; the sender delivers them in
+                # priority order and reports one result per transition
+                results = await send_alerts(to_send, current_health.status.value)
+
+                alerts_sent = 0
+                for transition, result in zip(to_send, results):
+                    if result is True:
+                        await record_alert_sent(transition)
+                        alerts_sent += 1
+                        continue
+
+                    if isinstance(result, Exception):
+                        log.warning(
+                            "⚠️ Failed to send alert for %s: %s", transition.entity_name, result
+                        )
+                    else:
+                        log.warning("⚠️ Failed to send alert for %s", transition.entity_name)
+                    # Let the next transition (or another replica) alert again
+                    await release_alert(transition)
+
+                if alerts_sent > 0:
+                    log.info("✅ Sent %d alert(s)", alerts_sent)
+
+            finally:
+                # Join metrics recording - failures are logged, never raised,
+                # so metrics problems can't break alerting
+                if metrics_task is not None:
+                    (metrics_error,) = await asyncio.gather(
+                        metrics_task, return_exceptions=True
+                    )
+                    if isinstance(metrics_error, Exception):
+                        log.warning("⚠️ Metrics recording error: %s", metrics_error)
 
         except asyncio.CancelledError:
-            log_info("🛑 Health check loop cancelled")
+            log.info("🛑 Health check loop cancelled")
             raise  # Re-raise to properly exit
 
         except Exception as e:
-            log_error(f"❌ Health check loop error: {e}")
-            # Continue running - don't crash the loop on errors
-            await asyncio.sleep(5)  # Brief pause before retrying
+            # Continue running - the next iteration waits for the next tick
+            log.error("❌ Health check loop error: %s", e)
+
+    log.info("🛑 Health check loop stopped")
 
 
 # =============================================================================
 # Daily Maintenance Task
 # =============================================================================
 async def daily_maintenance_loop(
-    metrics_manager: MetricsManager,
+    metrics_manager: "MetricsManager",
     maintenance_hour: int,
-    logger: Optional[object] = None,
+    logger: _LoggerLike = _NULL_LOGGER,
+    trigger: Optional[asyncio.Event] = None,
+    stop_event: Optional[asyncio.Event] = None,
 ) -> None:
     """
     Background task that runs daily maintenance at a configured hour.
@@ -211,56 +422,158 @@ async def daily_maintenance_loop(
         - Daily aggregation of previous day's snapshots
         - Cleanup of old data based on retention policy
 
+    Setting ``trigger`` wakes the loop immediately: maintenance runs right
+    away, unless ``stop_event`` is also set, in which case the loop exits.
+
     Args:
         metrics_manager: MetricsManager instance
         maintenance_hour: Hour (UTC) to run maintenance (0-23)
-        logger: Optional logger instance
+        logger: Logger manager (defaults to a null logger)
+        trigger: Optional event that requests an immediate run (or wakes the
+            loop for shutdown)
+        stop_event: Optional event that ends the loop once it is woken
     """
-    log = logger.get_logger("maintenance") if logger else None
+    log = logger.get_logger("maintenance")
+
+    if trigger is None:
+        trigger = asyncio.Event()
+    if stop_event is None:
+        stop_event = asyncio.Event()
 
-    def log_info(msg: str) -> None:
-        if log:
-            log.info(msg)
+    async def wait_for_trigger(timeout: float) -> bool:
+        """Wait up to timeout seconds; return True if woken by the trigger."""
+        try:
+            await asyncio.wait_for(trigger.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        trigger.clear()
+        return True
 
-    def log_error(msg: str) -> None:
-        if log:
-            log.error(msg)
+    log.info("🔧 Maintenance loop started (runs at %02d:00 UTC)", maintenance_hour)
 
-    log_info(f"🔧 Maintenance loop started (runs at {maintenance_hour:02d}:00 UTC)")
+    run_now = False
+    retry_delay = MAINTENANCE_RETRY_INITIAL_SECONDS
 
     while True:
         try:
-            # Calculate time until next maintenance window
-            now = datetime.now(timezone.utc)
-            target = now.replace(
-                hour=maintenance_hour, minute=0, second=0, microsecond=0
-            )
-
-            # If we've passed today's window, schedule for tomorrow
-            if now >= target:
-                target = target.replace(day=target.day + 1)
-
-            # Sleep until maintenance time
-            sleep_seconds = (target - now).total_seconds()
-            log_info(
-                f"💤 Next maintenance in {sleep_seconds / 3600:.1f} hours "
-                f"({target.isoformat()})"
-            )
-            await asyncio.sleep(sleep_seconds)
+            if not run_now:
+                # Calculate time until next maintenance window
+                now = datetime.now(timezone.utc)
+                target = now.replace(
+                    hour=maintenance_hour, minute=0, second=0, microsecond=0
+                )
+
+                # If we've passed today's window, schedule for tomorrow
+                if now >= target:
+                    target += timedelta(days=1)
+
+                log.info(
+                    "💤 Next maintenance in %.1f hours (%s)",
+                    (target - now).total_seconds() / 3600,
+                    target.isoformat(),
+                )
+
+                # Wait until maintenance time in bounded chunks, re-checking
+                # the wall clock after each one so drift never fires early or
+                # late; the trigger cuts the wait short
+                while True:
+                    remaining = (target - datetime.now(timezone.utc)).total_seconds()
+                    if remaining <= 0:
+                        break
+                    if await wait_for_trigger(min(remaining, MAINTENANCE_MAX_SLEEP_SECONDS)):
+                        break
+
+            run_now = False
+            if stop_event.is_set():
+                break
 
             # Run maintenance
-            log_info("🔧 Running daily maintenance...")
+            log.info("🔧 Running daily maintenance...")
             await metrics_manager.daily_maintenance()
-            log_info("✅ Daily maintenance complete")
+            log.info("✅ Daily maintenance complete")
+            retry_delay = MAINTENANCE_RETRY_INITIAL_SECONDS
 
         except asyncio.CancelledError:
-            log_info("🛑 Maintenance loop cancelled")
+            log.info("🛑 Maintenance loop cancelled")
             raise
 
-        except Exception as e:
-            log_error(f"❌ Maintenance error: {e}")
-            # Wait an hour before retrying
-            await asyncio.sleep(3600)
+        except Exception:
+            log.exception("❌ Maintenance error")
+
+            # Retry with exponential backoff plus jitter (a trigger retries
+            # immediately)
+            await wait_for_trigger(retry_delay + random.uniform(0, retry_delay * 0.1))
+            retry_delay = min(retry_delay * 2, MAINTENANCE_RETRY_MAX_SECONDS)
+            run_now = True
+            if stop_event.is_set():
+                break
+
+    log.info("🛑 Maintenance loop stopped")
+
+
+# =============================================================================
+# Startup Helpers
+# =============================================================================
+@contextmanager
+def eager_task_start() -> Iterator[None]:
+    """
+    Start tasks created inside this block eagerly (Python 3.12+).
+
+    With asyncio.eager_task_factory a new task runs synchronously up to its
+    first real await instead of waiting for another event loop iteration.
+    The previous factory is restored on exit so only startup tasks are
+    affected, not tasks created later by the server. On older Pythons this
+    is a no-op.
+    """
+    eager_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_factory is None:
+        yield
+        return
+
+    loop = asyncio.get_running_loop()
+    previous_factory = loop.get_task_factory()
+    loop.set_task_factory(eager_factory)
+    try:
+        yield
+    finally:
+        loop.set_task_factory(previous_factory)
+
+
+async def initialize_metrics(
+    config_manager: ConfigManager,
+    logger: _LoggerLike = _NULL_LOGGER,
+) -> Optional["MetricsManager"]:
+    """
+    Create and initialize the metrics manager.
+
+    Runs as a startup task so the database open/schema work overlaps with
+    the rest of startup. Failures are logged rather than raised so a broken
+    metrics database never prevents the API from starting.
+
+    Args:
+        config_manager: ConfigManager instance
+        logger: Logger manager (defaults to a null logger)
+
+    Returns:
+        Initialized MetricsManager, or None if initialization failed
+    """
+    log = logger.get_logger("main")
+
+    try:
+        from src.managers.metrics import create_metrics_manager
+
+        metrics_manager = create_metrics_manager(
+            config_manager=config_manager,
+            logger=logger,
+        )
+        await metrics_manager.initialize()
+        log.info(f"✅ Metrics database initialized at {config_manager.metrics_db_path}")
+        return metrics_manager
+
+    except Exception as e:
+        log.error(f"❌ Failed to initialize metrics: {e}")
+        log.warning("⚠️ Continuing without metrics - health monitoring still active")
+        return None
 
 
 # =============================================================================
@@ -273,7 +586,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Handles startup and shutdown tasks:
         - Startup: Initialize configuration, logging, managers, and background tasks
-        - Shutdown: Cancel background tasks and cleanup resources
+        - Shutdown: Stop and join background tasks, then cleanup resources
     """
     # =========================================================================
     # STARTUP
@@ -287,169 +600,224 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
     log = bootstrap_logger.get_logger("main")
 
-    log.info("=" * 70)
-    log.info("🌳 Ash Ecosystem Health API - Starting Up")
-    log.info("=" * 70)
+    log.info(_STARTUP_BANNER)
 
-    # Load configuration
-    log.info("📋 Loading configuration...")
+    # Configuration is loaded once per process (create_app() reads CORS
+    # settings from it at import); attach our logger to the shared instance
     config_manager = create_config_manager(logger=bootstrap_logger)
+    log.info("📋 Configuration loaded")
 
-    # Reconfigure logging with loaded settings
-    logger = create_logging_config_manager(
+    # Reconfigure logging with loaded settings (updates handlers in place)
+    logger = bootstrap_logger
+    logger.reconfigure(
         level=config_manager.log_level,
         log_format=config_manager.log_format,
         log_file=config_manager.log_file,
         console_enabled=config_manager.log_console,
-        app_name="ash",
     )
-    log = logger.get_logger("main")
 
     log.info(f"🔧 Environment: {config_manager.environment}")
     log.info(f"🔧 Log Level: {config_manager.log_level}")
 
-    # Initialize the Ecosystem Health Manager
-    log.info("🏥 Initializing Ecosystem Health Manager...")
-    ecosystem_manager = create_ecosystem_health_manager(
-        config_manager=config_manager,
-        logger=logger,
-    )
-
-    # =========================================================================
-    # Initialize Metrics (Phase 5)
-    # =========================================================================
-    metrics_manager: Optional[MetricsManager] = None
-    maintenance_task: Optional[asyncio.Task] = None
-
-    if config_manager.metrics_enabled:
-        log.info("📊 Initializing Metrics System...")
-
-        try:
-            metrics_manager = create_metrics_manager(
-                config_manager=config_manager,
-                logger=logger,
-            )
-            await metrics_manager.initialize()
-            log.info(f"✅ Metrics database initialized at {config_manager.metrics_db_path}")
-
-            # Start maintenance task
-            maintenance_task = asyncio.create_task(
-                daily_maintenance_loop(
-                    metrics_manager=metrics_manager,
-                    maintenance_hour=config_manager.metrics_maintenance_hour,
-                    logger=logger,
-                )
-            )
-            log.info(
-                f"🔧 Maintenance task started (runs at "
-                f"{config_manager.metrics_maintenance_hour:02d}:00 UTC)"
-            )
+    # Only one worker runs the background loops (see acquire_background_leader)
+    leader_lock = acquire_background_leader()
+    if leader_lock is None:
+        log.info(f"👥 Worker {os.getpid()} serving API only (background loops run elsewhere)")
 
-        except Exception as e:
-            log.error(f"❌ Failed to initialize metrics: {e}")
-            log.warning("⚠️ Continuing without metrics - health monitoring still active")
-            metrics_manager = None
-    else:
-        log.info("ℹ️ Metrics collection is disabled via configuration")
-
-    # =========================================================================
-    # Initialize Alerting (Phase 4)
-    # =========================================================================
-    health_check_task: Optional[asyncio.Task] = None
-
-    if config_manager.alerting_enabled:
-        log.info("🔔 Initializing Alerting System...")
+    try:
+        # One pooled HTTP client for all health checks (API requests and the
+        # background loop), so connections are reused instead of reopened
+        http_client = create_health_check_client(config_manager.check_timeout_ms / 1000.0)
 
-        # Create Alert Manager
-        alert_manager = create_alert_manager(
+        # Initialize the Ecosystem Health Manager
+        log.info("🏥 Initializing Ecosystem Health Manager...")
+        ecosystem_manager = create_ecosystem_health_manager(
             config_manager=config_manager,
             logger=logger,
+            client=http_client,
         )
 
-        # Create Discord Webhook Sender
-        webhook_sender = create_discord_webhook_sender(
-            logger=logger,
-        )
+        # =========================================================================
+        # Initialize Metrics (Phase 5) and Alerting (Phase 4)
+        # =========================================================================
+        # Metrics initialization is the only I/O-bound startup step (aiosqlite
+        # runs it on its own thread), so it proceeds while alerting is set up
+        alert_manager: Optional["AlertManager"] = None
+        webhook_sender: Optional["DiscordWebhookSender"] = None
+        redis_client: Optional["Redis"] = None
+        metrics_init_task: Optional[asyncio.Task] = None
+
+        async with asyncio.TaskGroup() as startup_tasks:
+            if config_manager.metrics_enabled:
+                log.info("📊 Initializing Metrics System...")
+                with eager_task_start():
+                    metrics_init_task = startup_tasks.create_task(
+                        initialize_metrics(config_manager=config_manager, logger=logger),
+                        name="metrics_init",
+                    )
+                # Yield once so the task starts its first database operation
+                # before the synchronous alerting setup below runs (already the
+                # case when the task was started eagerly)
+                await asyncio.sleep(0)
+            else:
+                log.info("ℹ️ Metrics collection is disabled via configuration")
+
+            if config_manager.alerting_enabled:
+                log.info("🔔 Initializing Alerting System...")
+
+                from src.managers.alerting import (
+                    create_alert_manager,
+                    create_discord_webhook_sender,
+                    create_redis_client,
+                )
 
-        if webhook_sender.is_configured:
-            log.info("✅ Discord webhook configured")
-
-            # Start background health check loop
-            health_check_task = asyncio.create_task(
-                health_check_loop(
-                    health_manager=ecosystem_manager,
-                    alert_manager=alert_manager,
-                    webhook_sender=webhook_sender,
-                    metrics_manager=metrics_manager,  # Pass metrics manager
-                    interval_seconds=config_manager.alerting_check_interval_seconds,
+                # Create Discord Webhook Sender
+                webhook_sender = create_discord_webhook_sender(
                     logger=logger,
                 )
-            )
-            log.info(
-                f"🔄 Health check loop started "
-                f"(interval: {config_manager.alerting_check_interval_seconds}s, "
-                f"cooldown: {config_manager.alerting_cooldown_seconds}s)"
-            )
-
-            # Store alerting components in app state
-            app.state.alert_manager = alert_manager
-            app.state.webhook_sender = webhook_sender
-        else:
-            log.warning("⚠️ Discord webhook not configured - alerting disabled")
-    else:
-        log.info("ℹ️ Alerting is disabled via configuration")
-
-    # Store managers in app state for dependency injection
-    app.state.config_manager = config_manager
-    app.state.logger = logger
-    app.state.ecosystem_manager = ecosystem_manager
-    app.state.metrics_manager = metrics_manager
-
-    log.info("=" * 70)
-    log.info("✅ Ash Ecosystem Health API - Ready")
-    log.info(f"🌐 Listening on {config_manager.server_host}:{config_manager.server_port}")
-    if metrics_manager:
-        log.info("📊 Metrics collection: ENABLED")
-    log.info("=" * 70)
-
-    # Yield control to the application
-    yield
 
-    # =========================================================================
-    # SHUTDOWN
-    # =========================================================================
-    log.info("=" * 70)
-    log.info("🛑 Ash Ecosystem Health API - Shutting Down")
-    log.info("=" * 70)
-
-    # Cancel the health check loop if running
-    if health_check_task is not None:
-        log.info("🔄 Stopping health check loop...")
-        health_check_task.cancel()
-        try:
-            await health_check_task
-        except asyncio.CancelledError:
-            pass
-        log.info("✅ Health check loop stopped")
+                if webhook_sender.is_configured:
+                    log.info("✅ Discord webhook configured")
+
+                    # Shared cooldowns (None = in-process only)
+                    redis_client = await create_redis_client(
+                        config_manager=config_manager,
+                        logger=logger,
+                    )
+
+                    # Create Alert Manager
+                    alert_manager = create_alert_manager(
+                        config_manager=config_manager,
+                        logger=logger,
+                        redis_client=redis_client,
+                    )
+
+                    # Store alerting components in app state
+                    app.state.alert_manager = alert_manager
+                    app.state.webhook_sender = webhook_sender
+                else:
+                    log.warning("⚠️ Discord webhook not configured - alerting disabled")
+            else:
+                log.info("ℹ️ Alerting is disabled via configuration")
 
-    # Cancel maintenance task if running
-    if maintenance_task is not None:
-        log.info("🔧 Stopping maintenance task...")
-        maintenance_task.cancel()
-        try:
-            await maintenance_task
-        except asyncio.CancelledError:
-            pass
-        log.info("✅ Maintenance task stopped")
+        metrics_manager: Optional["MetricsManager"] = (
+            metrics_init_task.result() if metrics_init_task is not None else None
+        )
 
-    # Close metrics database
-    if metrics_manager is not None:
-        log.info("📊 Closing metrics database...")
-        await metrics_manager.close()
-        log.info("✅ Metrics database closed")
+        # Store managers in app state for dependency injection
+        app.state.config_manager = config_manager
+        app.state.logger = logger
+        app.state.ecosystem_manager = ecosystem_manager
+        app.state.http_client = http_client
+        app.state.metrics_manager = metrics_manager
+
+        # =========================================================================
+        # Background Tasks (leader worker only)
+        # =========================================================================
+        # The TaskGroup spans the application's lifetime: shutdown sets stop_event
+        # and the group joins every task before resources are released below.
+        stop_event = asyncio.Event()
+
+        # Setting the trigger runs maintenance immediately (leader worker only)
+        maintenance_trigger: Optional[asyncio.Event] = None
+
+        async with asyncio.TaskGroup() as background_tasks:
+            # Loops run straight to their first wait instead of waiting for
+            # another event loop iteration
+            with eager_task_start():
+                if leader_lock is not None and metrics_manager is not None:
+                    maintenance_trigger = asyncio.Event()
+                    background_tasks.create_task(
+                        daily_maintenance_loop(
+                            metrics_manager=metrics_manager,
+                            maintenance_hour=config_manager.metrics_maintenance_hour,
+                            logger=logger,
+                            trigger=maintenance_trigger,
+                            stop_event=stop_event,
+                        ),
+                        name="maintenance_loop",
+                    )
+                    log.info(
+                        f"🔧 Maintenance task started (runs at "
+                        f"{config_manager.metrics_maintenance_hour:02d}:00 UTC)"
+                    )
+
+                # Only runs when there is per-tick work: alerting and/or metrics. With
+                # both disabled, health is checked on demand via /health/ecosystem only.
+                if leader_lock is not None and (alert_manager is not None or metrics_manager is not None):
+                    background_tasks.create_task(
+                        health_check_loop(
+                            health_manager=ecosystem_manager,
+                            alert_manager=alert_manager,
+                            webhook_sender=webhook_sender if alert_manager is not None else None,
+                            metrics_manager=metrics_manager,
+                            interval_seconds=config_manager.alerting_check_interval_seconds,
+                            logger=logger,
+                            stop_event=stop_event,
+                        ),
+                        name="health_check_loop",
+                    )
+                    log.info(
+                        f"🔄 Health check loop started "
+                        f"(interval: {config_manager.alerting_check_interval_seconds}s, "
+                        f"alerting: {'on' if alert_manager is not None else 'off'}, "
+                        f"metrics: {'on' if metrics_manager is not None else 'off'})"
+                    )
+                elif leader_lock is not None:
+                    log.info("ℹ️ Health check loop not started (alerting and metrics both disabled)")
+
+            app.state.maintenance_trigger = maintenance_trigger
+
+            ready_lines = [
+                _BANNER,
+                "✅ Ash Ecosystem Health API - Ready",
+                f"🌐 Listening on {config_manager.server_host}:{config_manager.server_port}",
+            ]
+            if metrics_manager:
+                ready_lines.append("📊 Metrics collection: ENABLED")
+            ready_lines.append(_BANNER)
+            log.info("\n".join(ready_lines))
+
+            # Yield control to the application
+            yield
+
+            # =====================================================================
+            # SHUTDOWN
+            # =====================================================================
+            log.info(_SHUTDOWN_BANNER)
+
+            # Both loops finish any in-flight work (webhook sends, a maintenance
+            # run) and exit on their own; the trigger wakes the maintenance wait
+            log.info("🔄 Stopping background tasks...")
+            stop_event.set()
+            if maintenance_trigger is not None:
+                maintenance_trigger.set()
+
+        log.info("✅ Background tasks stopped")
+
+        # Close the HTTP clients once no more checks or alerts can be in flight
+        await http_client.aclose()
+        if webhook_sender is not None:
+            await webhook_sender.close()
+        if redis_client is not None:
+            await redis_client.aclose()
+
+        # Close metrics database
+        if metrics_manager is not None:
+            log.info("📊 Closing metrics database...")
+            await metrics_manager.close()
+            log.info("✅ Metrics database closed")
+    finally:
+        # Release background leadership so a restarted worker can take over,
+        # including when startup fails before the app is served
+        if leader_lock is not None:
+            leader_lock.close()
 
     log.info("✅ Shutdown complete")
 
+    # Last: flush queued file log records and close the log file
+    logger.close()
+
 
 # =============================================================================
 # Create FastAPI Application
@@ -473,6 +841,7 @@ def create_app() -> FastAPI:
         ),
         version=__version__,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
@@ -481,17 +850,19 @@ def create_app() -> FastAPI:
     # =========================================================================
     # CORS Middleware
     # =========================================================================
-    # Allow Ash-Dash and other internal services to access the API
+    # Allow Ash-Dash and other internal services to access the API.
+    # Origins come from config (cors.allowed_origins as an exact-match set,
+    # plus the optional cors.allowed_origin_regex); explicit headers and a
+    # long max_age let browsers cache preflights instead of repeating them.
+    config_manager = create_config_manager()
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "https://crt.alphabetcartel.net",  # Ash-Dash production
-            "http://localhost:3000",            # Ash-Dash development
-            "http://localhost:5173",            # Vite dev server
-        ],
+        allow_origins=config_manager.cors_allowed_origins,
+        allow_origin_regex=config_manager.cors_allowed_origin_regex,
         allow_credentials=True,
         allow_methods=["GET", "OPTIONS"],
-        allow_headers=["*"],
+        allow_headers=CORS_ALLOWED_HEADERS,
+        max_age=CORS_MAX_AGE_SECONDS,
     )
 
     # =========================================================================
@@ -500,12 +871,27 @@ def create_app() -> FastAPI:
     app.include_router(health_router)
     app.include_router(metrics_router)
 
+    # =========================================================================
+    # Prometheus Instrumentation
+    # =========================================================================
+    # Per-endpoint request latency histograms, so tuning is driven by which
+    # handler is actually slow under production load
+    if config_manager.prometheus_enabled and Instrumentator is not None:
+        Instrumentator(
+            excluded_handlers=PROMETHEUS_EXCLUDED_HANDLERS,
+        ).instrument(app).expose(app, endpoint=PROMETHEUS_PATH, include_in_schema=False)
+
     return app
 
 
 # =============================================================================
 # Application Instance
 # =============================================================================
+# Install uvloop before the app is created so externally launched ASGI servers
+# (e.g. gunicorn -k uvicorn.workers.UvicornWorker) also run on uvloop
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 app = create_app()
 
 
@@ -522,6 +908,10 @@ if __name__ == "__main__":
         "main:app",
         host=config.server_host,
         port=config.server_port,
+        workers=config.server_workers,
         reload=False,
         log_level="info",
+        loop="uvloop" if uvloop is not None else "asyncio",
+        http="httptools" if httptools is not None else "h11",
+        server_header=False,
     )
@@ -21,11 +21,13 @@ Repository: https://github.com/the-alphabet-cartel/ash
 ============================================================================
 """
 
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, Request, Response
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from src.managers.ecosystem.ecosystem_health_manager import (
     ComponentStatus,
@@ -40,11 +42,54 @@ router = APIRouter(tags=["Health"])
 
 
 # =============================================================================
-# Dependency Injection Helper
+# Cached Timestamp (1-second granularity)
 # =============================================================================
-def get_ecosystem_manager(request: Request) -> EcosystemHealthManager:
-    """Get the EcosystemHealthManager from app state."""
-    return request.app.state.ecosystem_manager
+_timestamp_second: int = -1
+_timestamp_iso: str = ""
+
+
+def _utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string, truncated to the second.
+
+    The string is rebuilt at most once per second, so frequent probes share
+    it instead of each formatting a new datetime.
+    """
+    global _timestamp_second, _timestamp_iso
+
+    second = int(time.time())
+    if second != _timestamp_second:
+        _timestamp_iso = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _timestamp_second = second
+    return _timestamp_iso
+
+
+# =============================================================================
+# Pre-serialized Probe Bodies
+# =============================================================================
+# "/" is constant and "/health" only varies by timestamp, so their JSON is
+# built once at import instead of per request (probes hit these constantly)
+_SERVICE_INFO: Dict[str, Any] = {
+    "service": "Ash Ecosystem Health API",
+    "description": "Centralized health monitoring for the Ash Crisis Detection Ecosystem",
+    "version": "v5.0-1",
+    "community": {
+        "name": "The Alphabet Cartel",
+        "discord": "https://discord.gg/alphabetcartel",
+        "website": "https://alphabetcartel.org",
+    },
+    "endpoints": {
+        "/": "This endpoint - service information",
+        "/health": "Liveness probe - is the service running?",
+        "/health/ready": "Readiness probe - is the service ready to serve?",
+        "/health/ecosystem": "Full ecosystem health report",
+    },
+    "documentation": "/docs",
+}
+
+_ROOT_BODY = orjson.dumps(_SERVICE_INFO)
+_LIVENESS_BODY_PREFIX = b'{"status":"healthy","service":"ash-ecosystem-api","timestamp":"'
+_LIVENESS_BODY_SUFFIX = b'"}'
 
 
 # =============================================================================
@@ -54,31 +99,15 @@ def get_ecosystem_manager(request: Request) -> EcosystemHealthManager:
     "/",
     summary="Service Information",
     description="Returns information about the Ash Ecosystem Health API and available endpoints.",
-    response_model=Dict[str, Any],
+    response_class=Response,
 )
-async def root() -> Dict[str, Any]:
+async def root() -> Response:
     """
     Service information endpoint.
 
     Returns basic information about the service and available endpoints.
     """
-    return {
-        "service": "Ash Ecosystem Health API",
-        "description": "Centralized health monitoring for the Ash Crisis Detection Ecosystem",
-        "version": "v5.0-1",
-        "community": {
-            "name": "The Alphabet Cartel",
-            "discord": "https://discord.gg/alphabetcartel",
-            "website": "https://alphabetcartel.org",
-        },
-        "endpoints": {
-            "/": "This endpoint - service information",
-            "/health": "Liveness probe - is the service running?",
-            "/health/ready": "Readiness probe - is the service ready to serve?",
-            "/health/ecosystem": "Full ecosystem health report",
-        },
-        "documentation": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # =============================================================================
@@ -88,32 +117,35 @@ async def root() -> Dict[str, Any]:
     "/health",
     summary="Liveness Probe",
     description="Simple liveness check - returns 200 if the service is running.",
-    response_model=Dict[str, Any],
+    response_class=Response,
 )
-async def health_liveness() -> Dict[str, Any]:
+async def health_liveness() -> Response:
     """
     Liveness probe endpoint.
 
     Returns 200 OK if the service is running. Used by container orchestrators
     (Docker, Kubernetes) to determine if the service should be restarted.
     """
-    return {
-        "status": "healthy",
-        "service": "ash-ecosystem-api",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    return Response(
+        content=(
+            _LIVENESS_BODY_PREFIX
+            + _utc_now_iso().encode()
+            + _LIVENESS_BODY_SUFFIX
+        ),
+        media_type="application/json",
+    )
 
 
-# Kubernetes-style alias
-@router.get(
+# Kubernetes-style alias (same handler, no extra coroutine per probe)
+router.add_api_route(
     "/healthz",
+    health_liveness,
+    methods=["GET"],
     summary="Liveness Probe (K8s alias)",
     description="Kubernetes-style liveness probe alias.",
+    response_class=Response,
     include_in_schema=False,
 )
-async def health_liveness_k8s() -> Dict[str, Any]:
-    """Kubernetes-style liveness probe alias."""
-    return await health_liveness()
 
 
 # =============================================================================
@@ -123,11 +155,15 @@ async def health_liveness_k8s() -> Dict[str, Any]:
     "/health/ready",
     summary="Readiness Probe",
     description="Readiness check - returns 200 if the service is ready to accept requests.",
-    response_model=Dict[str, Any],
+    response_model=None,
+    responses={
+        200: {"description": "Service is ready"},
+        503: {"description": "Service is not fully initialized"},
+    },
 )
 async def health_readiness(
     request: Request,
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Readiness probe endpoint.
 
@@ -138,42 +174,45 @@ async def health_readiness(
     try:
         manager = request.app.state.ecosystem_manager
         if manager is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={
                     "status": "unhealthy",
                     "error": "Ecosystem manager not initialized",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": _utc_now_iso(),
                 },
             )
     except AttributeError:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "error": "Service not fully initialized",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _utc_now_iso(),
             },
         )
 
-    return {
-        "status": "healthy",
-        "ready": True,
-        "service": "ash-ecosystem-api",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    # Returned as a response object so FastAPI skips jsonable_encoder
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "ready": True,
+            "service": "ash-ecosystem-api",
+            "timestamp": _utc_now_iso(),
+        }
+    )
 
 
-# Kubernetes-style alias
-@router.get(
+# Kubernetes-style alias (same handler, no extra coroutine per probe)
+router.add_api_route(
     "/readyz",
+    health_readiness,
+    methods=["GET"],
+    response_model=None,
     summary="Readiness Probe (K8s alias)",
     description="Kubernetes-style readiness probe alias.",
     include_in_schema=False,
 )
-async def health_readiness_k8s(request: Request) -> Dict[str, Any]:
-    """Kubernetes-style readiness probe alias."""
-    return await health_readiness(request)
 
 
 # =============================================================================
@@ -187,7 +226,7 @@ async def health_readiness_k8s(request: Request) -> Dict[str, Any]:
         "an aggregated report including component status, connection health, "
         "and overall ecosystem status."
     ),
-    response_model=Dict[str, Any],
+    response_model=None,
     responses={
         200: {
             "description": "Ecosystem is healthy or degraded",
@@ -229,10 +268,7 @@ async def health_readiness_k8s(request: Request) -> Dict[str, Any]:
         },
     },
 )
-async def health_ecosystem(
-    response: Response,
-    manager: EcosystemHealthManager = Depends(get_ecosystem_manager),
-) -> Dict[str, Any]:
+async def health_ecosystem(request: Request) -> ORJSONResponse:
     """
     Full ecosystem health check endpoint.
 
@@ -244,14 +280,21 @@ async def health_ecosystem(
         200: If ecosystem is healthy or degraded
         503: If ecosystem has unhealthy or unreachable components
     """
+    # Read the manager from app state directly (no Depends() resolution)
+    manager: EcosystemHealthManager = request.app.state.ecosystem_manager
+
     # Perform the ecosystem health check
     health = await manager.check_ecosystem_health()
 
-    # Set appropriate HTTP status code based on ecosystem status
-    if health.status in (ComponentStatus.UNHEALTHY, ComponentStatus.UNREACHABLE):
-        response.status_code = 503
+    # Set appropriate HTTP status code based on ecosystem status; the report
+    # is already JSON-safe, so it goes straight to orjson (no jsonable_encoder)
+    status_code = (
+        503
+        if health.status in (ComponentStatus.UNHEALTHY, ComponentStatus.UNREACHABLE)
+        else 200
+    )
 
-    return health.to_dict()
+    return ORJSONResponse(health.to_dict(), status_code=status_code)
 
 
 __all__ = ["router"]
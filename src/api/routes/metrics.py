@@ -22,19 +22,39 @@ Repository: https://github.com/the-alphabet-cartel/ash
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 
 router = APIRouter(prefix="/metrics", tags=["Metrics"])
 
+# Serialized /history rows are flushed to the client in batches of this size
+HISTORY_STREAM_BATCH_ROWS = 100
+
+# /history downsampling resolutions and their bucket sizes in seconds
+HistoryResolution = Literal["1m", "5m", "15m", "1h"]
+RESOLUTION_SECONDS: Dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+}
+
 
 # =============================================================================
-# Dependency: Get Metrics Manager
+# Helper: Get Metrics Manager
 # =============================================================================
-async def get_metrics_manager(request: Request):
-    """Dependency to get the MetricsManager from app state."""
+def get_metrics_manager(request: Request):
+    """
+    Get the MetricsManager from app state, or fail with 503.
+
+    Called directly by each handler rather than through Depends(), which
+    would run FastAPI's dependency resolver on every request for what is
+    just an attribute lookup.
+    """
     metrics_manager = getattr(request.app.state, "metrics_manager", None)
     if metrics_manager is None:
         raise HTTPException(
@@ -44,11 +64,63 @@ async def get_metrics_manager(request: Request):
     return metrics_manager
 
 
+# =============================================================================
+# Helper: Incident Pagination Cursors
+# =============================================================================
+INCIDENT_CURSOR_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def encode_incident_cursor(timestamp: datetime, incident_id: int) -> str:
+    """Encode the (timestamp, id) keyset of an incident as a cursor string."""
+    return f"{timestamp.strftime(INCIDENT_CURSOR_TIME_FORMAT)}_{incident_id}"
+
+
+def decode_incident_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_incident_cursor, or fail with 400.
+    """
+    try:
+        timestamp_str, id_str = cursor.rsplit("_", 1)
+        timestamp = datetime.strptime(timestamp_str, INCIDENT_CURSOR_TIME_FORMAT)
+        return timestamp.replace(tzinfo=timezone.utc), int(id_str)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+
+
+# =============================================================================
+# Helper: History Streaming
+# =============================================================================
+async def _read_history_batch(buckets: AsyncIterator[Any]) -> List[bytes]:
+    """
+    Serialize up to HISTORY_STREAM_BATCH_ROWS downsampled buckets.
+
+    Returns an empty list once the iterator is exhausted.
+    """
+    batch: List[bytes] = []
+    async for bucket in buckets:
+        batch.append(
+            orjson.dumps(
+                {
+                    "timestamp": bucket.timestamp,
+                    "ecosystem_status": bucket.ecosystem_status,
+                    "components": {
+                        name: data.get("status", "unknown") if isinstance(data, dict) else "unknown"
+                        for name, data in bucket.components.items()
+                    },
+                }
+            )
+        )
+        if len(batch) >= HISTORY_STREAM_BATCH_ROWS:
+            break
+    return batch
+
+
 # =============================================================================
 # Uptime Endpoints
 # =============================================================================
-@router.get("/uptime")
+@router.get("/uptime", response_model=None)
 async def get_uptime(
+    request: Request,
     component: Optional[str] = Query(
         default=None,
         description="Filter to specific component (e.g., 'ash_bot')",
@@ -59,14 +131,15 @@ async def get_uptime(
         le=90,
         description="Number of days to calculate uptime for",
     ),
-    metrics_manager=Depends(get_metrics_manager),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get uptime metrics for all or specific components.
 
     Returns uptime percentages, incident counts, and Mean Time To Recovery (MTTR)
     for the specified time period.
     """
+    metrics_manager = get_metrics_manager(request)
+
     uptime_data = await metrics_manager.get_uptime(
         component=component,
         days=days,
@@ -76,65 +149,57 @@ async def get_uptime(
     end = datetime.now(timezone.utc)
     start = end - timedelta(days=days)
 
-    # Build response
+    # Build per-component entries and ecosystem totals in a single pass
     components = {}
-    ecosystem_stats = {
-        "total_healthy_seconds": 0,
-        "total_degraded_seconds": 0,
-        "total_unhealthy_seconds": 0,
-        "total_unreachable_seconds": 0,
-        "total_seconds": 0,
-        "total_incidents": 0,
-    }
+    total_healthy = total_degraded = total_seconds = total_incidents = 0
 
     for comp_name, metrics in uptime_data.items():
+        incident_count = metrics.incident_count
         components[comp_name] = {
             "uptime_percentage": round(metrics.uptime_percentage, 2),
             "healthy_percentage": round(metrics.healthy_percentage, 2),
             "degraded_percentage": round(metrics.degraded_percentage, 2),
-            "incident_count": metrics.incident_count,
+            "incident_count": incident_count,
             "mttr_seconds": metrics.mttr_seconds,
         }
 
-        # Aggregate for ecosystem stats
-        ecosystem_stats["total_healthy_seconds"] += metrics.healthy_seconds
-        ecosystem_stats["total_degraded_seconds"] += metrics.degraded_seconds
-        ecosystem_stats["total_unhealthy_seconds"] += metrics.unhealthy_seconds
-        ecosystem_stats["total_unreachable_seconds"] += metrics.unreachable_seconds
-        ecosystem_stats["total_seconds"] += metrics.total_seconds
-        ecosystem_stats["total_incidents"] += metrics.incident_count
+        total_healthy += metrics.healthy_seconds
+        total_degraded += metrics.degraded_seconds
+        total_seconds += metrics.total_seconds
+        total_incidents += incident_count
 
     # Calculate ecosystem-wide uptime
-    total = ecosystem_stats["total_seconds"]
-    if total > 0:
-        healthy = ecosystem_stats["total_healthy_seconds"]
-        degraded = ecosystem_stats["total_degraded_seconds"]
-        ecosystem_uptime = ((healthy + degraded) / total) * 100
-        ecosystem_healthy = (healthy / total) * 100
-        ecosystem_degraded = (degraded / total) * 100
+    if total_seconds > 0:
+        ecosystem_uptime = ((total_healthy + total_degraded) / total_seconds) * 100
+        ecosystem_healthy = (total_healthy / total_seconds) * 100
+        ecosystem_degraded = (total_degraded / total_seconds) * 100
     else:
         ecosystem_uptime = 100.0
         ecosystem_healthy = 100.0
         ecosystem_degraded = 0.0
 
-    return {
-        "period": {
-            "start": start.isoformat(),
-            "end": end.isoformat(),
-            "days": days,
-        },
-        "ecosystem": {
-            "uptime_percentage": round(ecosystem_uptime, 2),
-            "healthy_percentage": round(ecosystem_healthy, 2),
-            "degraded_percentage": round(ecosystem_degraded, 2),
-            "incident_count": ecosystem_stats["total_incidents"],
-        },
-        "components": components,
-    }
+    # Returned as a response object so FastAPI skips jsonable_encoder
+    return ORJSONResponse(
+        {
+            "period": {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "days": days,
+            },
+            "ecosystem": {
+                "uptime_percentage": round(ecosystem_uptime, 2),
+                "healthy_percentage": round(ecosystem_healthy, 2),
+                "degraded_percentage": round(ecosystem_degraded, 2),
+                "incident_count": total_incidents,
+            },
+            "components": components,
+        }
+    )
 
 
-@router.get("/uptime/{component}")
+@router.get("/uptime/{component}", response_model=None)
 async def get_component_uptime(
+    request: Request,
     component: str,
     days: int = Query(
         default=30,
@@ -142,11 +207,12 @@ async def get_component_uptime(
         le=90,
         description="Number of days to calculate uptime for",
     ),
-    metrics_manager=Depends(get_metrics_manager),
 ) -> Dict[str, Any]:
     """
     Get detailed uptime metrics for a specific component.
     """
+    metrics_manager = get_metrics_manager(request)
+
     uptime_data = await metrics_manager.get_uptime(
         component=component,
         days=days,
@@ -187,8 +253,9 @@ async def get_component_uptime(
 # =============================================================================
 # Incidents Endpoints
 # =============================================================================
-@router.get("/incidents")
+@router.get("/incidents", response_model=None)
 async def get_incidents(
+    request: Request,
     component: Optional[str] = Query(
         default=None,
         description="Filter to specific component",
@@ -205,189 +272,177 @@ async def get_incidents(
         le=200,
         description="Maximum number of incidents to return",
     ),
-    metrics_manager=Depends(get_metrics_manager),
-) -> Dict[str, Any]:
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor from a previous page to fetch older incidents",
+    ),
+) -> ORJSONResponse:
     """
     Get incident history.
 
     Returns a list of status transition events for the specified time period.
+    Pages are keyset-paginated: pass ``next_cursor`` back as ``cursor`` to
+    continue; it is null on the last page.
     """
+    metrics_manager = get_metrics_manager(request)
+
+    before = decode_incident_cursor(cursor) if cursor is not None else None
+
     incidents = await metrics_manager.get_incidents(
         component=component,
         days=days,
         limit=limit,
+        before=before,
     )
 
+    # A full page may have more behind it; a short page is the last one
+    next_cursor = None
+    if len(incidents) == limit:
+        last = incidents[-1]
+        next_cursor = encode_incident_cursor(last.timestamp, last.id)
+
     # Calculate period boundaries
     end = datetime.now(timezone.utc)
     start = end - timedelta(days=days)
 
-    return {
-        "incidents": [
-            {
-                "id": inc.id,
-                "timestamp": inc.timestamp.isoformat(),
-                "entity_type": inc.entity_type,
-                "entity_name": inc.entity_name,
-                "from_status": inc.from_status,
-                "to_status": inc.to_status,
-                "resolved_at": inc.resolved_at.isoformat() if inc.resolved_at else None,
-                "duration_seconds": inc.duration_seconds,
-                "error_message": inc.error_message,
-            }
-            for inc in incidents
-        ],
-        "total": len(incidents),
-        "period": {
-            "start": start.isoformat(),
-            "end": end.isoformat(),
-            "days": days,
-        },
-    }
+    # orjson encodes the aware datetimes natively (same ISO 8601 output as
+    # isoformat()), so they are passed through as-is
+    return ORJSONResponse(
+        {
+            "incidents": [
+                {
+                    "id": inc.id,
+                    "timestamp": inc.timestamp,
+                    "entity_type": inc.entity_type,
+                    "entity_name": inc.entity_name,
+                    "from_status": inc.from_status,
+                    "to_status": inc.to_status,
+                    "resolved_at": inc.resolved_at,
+                    "duration_seconds": inc.duration_seconds,
+                    "error_message": inc.error_message,
+                }
+                for inc in incidents
+            ],
+            "total": len(incidents),
+            "next_cursor": next_cursor,
+            "period": {
+                "start": start,
+                "end": end,
+                "days": days,
+            },
+        }
+    )
 
 
 # =============================================================================
 # History Endpoints
 # =============================================================================
-@router.get("/history")
+@router.get("/history", response_model=None)
 async def get_health_history(
+    request: Request,
     hours: int = Query(
         default=24,
         ge=1,
         le=168,
         description="Number of hours of history",
     ),
-    resolution: str = Query(
+    resolution: HistoryResolution = Query(
         default="5m",
-        pattern="^(1m|5m|15m|1h)$",
         description="Resolution for downsampling (1m, 5m, 15m, 1h)",
     ),
-    metrics_manager=Depends(get_metrics_manager),
-) -> Dict[str, Any]:
+) -> StreamingResponse:
     """
     Get historical health snapshots (downsampled).
 
     Returns ecosystem status at regular intervals for charting/visualization.
+    The body is streamed as rows are read from the database, so large
+    ranges (e.g. 168h at 1m) are never held in memory as one document.
+    The first batch is read before streaming starts, so query errors
+    return a 500; a failure after that aborts the response mid-body.
     """
+    metrics_manager = get_metrics_manager(request)
+
     # Calculate time range
     end = datetime.now(timezone.utc)
     start = end - timedelta(hours=hours)
 
-    # Get snapshots from database
-    snapshots = await metrics_manager._db.get_snapshots(
+    # Downsample based on resolution
+    interval = RESOLUTION_SECONDS[resolution]
+
+    period = {
+        "start": start,
+        "end": end,
+        "hours": hours,
+        "resolution": resolution,
+    }
+
+    # Bucketing happens in SQL: one row per interval (the last snapshot in
+    # it) instead of every raw snapshot in the range
+    buckets = metrics_manager._db.iter_downsampled_snapshots(
         start=start,
         end=end,
-        limit=10000,  # Raw limit
+        interval_seconds=interval,
     )
 
-    if not snapshots:
-        return {
-            "period": {
-                "start": start.isoformat(),
-                "end": end.isoformat(),
-                "hours": hours,
-                "resolution": resolution,
-            },
-            "snapshots": [],
-        }
+    # Read the first batch before the response starts, so a failing query
+    # surfaces as a 500 instead of a 200 with a truncated body
+    batch = await _read_history_batch(buckets)
 
-    # Downsample based on resolution
-    resolution_seconds = {
-        "1m": 60,
-        "5m": 300,
-        "15m": 900,
-        "1h": 3600,
-    }
-    interval = resolution_seconds[resolution]
+    async def generate() -> AsyncIterator[bytes]:
+        nonlocal batch
+        try:
+            # Same document shape as before: {"period": {...}, "snapshots": [...]}
+            yield b'{"period":' + orjson.dumps(period) + b',"snapshots":['
 
-    # Group snapshots by interval
-    downsampled = []
-    current_bucket = None
-    bucket_snapshots = []
+            separator = b""
+            while batch:
+                yield separator + b",".join(batch)
+                separator = b","
+                if len(batch) < HISTORY_STREAM_BATCH_ROWS:
+                    break
+                batch = await _read_history_batch(buckets)
 
-    for snapshot in sorted(snapshots, key=lambda s: s.timestamp):
-        # Calculate bucket timestamp (floor to interval)
-        bucket_ts = snapshot.timestamp.replace(
-            second=0, microsecond=0
-        )
-        bucket_minutes = (bucket_ts.minute // (interval // 60)) * (interval // 60)
-        bucket_ts = bucket_ts.replace(minute=bucket_minutes)
-
-        if current_bucket is None:
-            current_bucket = bucket_ts
-
-        if bucket_ts != current_bucket:
-            # Emit the bucket (use last snapshot in bucket)
-            if bucket_snapshots:
-                last = bucket_snapshots[-1]
-                downsampled.append({
-                    "timestamp": current_bucket.isoformat(),
-                    "ecosystem_status": last.ecosystem_status,
-                    "components": {
-                        name: data.get("status", "unknown") if isinstance(data, dict) else "unknown"
-                        for name, data in last.components.items()
-                    },
-                })
-            current_bucket = bucket_ts
-            bucket_snapshots = []
-
-        bucket_snapshots.append(snapshot)
-
-    # Don't forget the last bucket
-    if bucket_snapshots:
-        last = bucket_snapshots[-1]
-        downsampled.append({
-            "timestamp": current_bucket.isoformat(),
-            "ecosystem_status": last.ecosystem_status,
-            "components": {
-                name: data.get("status", "unknown") if isinstance(data, dict) else "unknown"
-                for name, data in last.components.items()
-            },
-        })
+            yield b"]}"
+        finally:
+            # Release the database cursor if the client disconnects early
+            await buckets.aclose()
 
-    return {
-        "period": {
-            "start": start.isoformat(),
-            "end": end.isoformat(),
-            "hours": hours,
-            "resolution": resolution,
-        },
-        "snapshots": downsampled,
-    }
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 # =============================================================================
 # Stats Endpoint
 # =============================================================================
-@router.get("/stats")
-async def get_metrics_stats(
-    metrics_manager=Depends(get_metrics_manager),
-) -> Dict[str, Any]:
+@router.get("/stats", response_model=None)
+async def get_metrics_stats(request: Request) -> ORJSONResponse:
     """
     Get metrics system statistics.
 
     Returns counts and storage information about the metrics database.
     """
-    # Get counts
-    total_snapshots = await metrics_manager._db.get_snapshot_count()
+    metrics_manager = get_metrics_manager(request)
 
-    last_24h = datetime.now(timezone.utc) - timedelta(hours=24)
-    snapshots_24h = await metrics_manager._db.get_snapshot_count(since=last_24h)
+    # Get counts (one query, briefly cached by the manager)
+    total_snapshots, snapshots_24h = await metrics_manager.get_snapshot_counts()
 
-    return {
-        "snapshots": {
-            "total": total_snapshots,
-            "last_24h": snapshots_24h,
-        },
-        "retention": {
-            "snapshots_days": metrics_manager._config.metrics_retention_snapshots_days,
-            "incidents_days": metrics_manager._config.metrics_retention_incidents_days,
-            "aggregates_days": metrics_manager._config.metrics_retention_aggregates_days,
-        },
-        "database": {
-            "path": metrics_manager._config.metrics_db_path,
-        },
-    }
+    config = metrics_manager._config
+
+    return ORJSONResponse(
+        {
+            "snapshots": {
+                "total": total_snapshots,
+                "last_24h": snapshots_24h,
+            },
+            "retention": {
+                "snapshots_days": config.metrics_retention_snapshots_days,
+                "incidents_days": config.metrics_retention_incidents_days,
+                "aggregates_days": config.metrics_retention_aggregates_days,
+            },
+            "database": {
+                "path": config.metrics_db_path,
+            },
+        }
+    )
 
 
 __all__ = ["router"]
@@ -33,6 +33,10 @@ from src.managers.alerting.discord_webhook import (
     create_discord_webhook_sender,
     load_webhook_url,
 )
+from src.managers.alerting.redis_client import (
+    create_redis_client,
+    load_redis_password,
+)
 
 __all__ = [
     # Alert Manager
@@ -45,4 +49,7 @@ __all__ = [
     "DiscordWebhookSender",
     "create_discord_webhook_sender",
     "load_webhook_url",
+    # Redis (shared cooldowns)
+    "create_redis_client",
+    "load_redis_password",
 ]
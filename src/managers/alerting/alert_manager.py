@@ -21,10 +21,11 @@ Repository: https://github.com/the-alphabet-cartel/ash
 ============================================================================
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.managers.config_manager import ConfigManager
 from src.managers.ecosystem.ecosystem_health_manager import (
@@ -33,6 +34,27 @@ from src.managers.ecosystem.ecosystem_health_manager import (
 )
 from src.managers.logging_config_manager import LoggingConfigManager
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+# =============================================================================
+# Status Lookup
+# =============================================================================
+# Status string -> ComponentStatus, used instead of ComponentStatus(...) for
+# every component and connection on each check. Unknown values fall back to
+# HEALTHY, the same default used when a status is missing.
+_STATUS_CACHE: Dict[str, ComponentStatus] = {
+    status.value: status for status in ComponentStatus
+}
+
+
+# Plural suffix for duration units, indexed by "count != 1"
+_PLURAL_SUFFIX = ("", "s")
+
+# Redis key prefix for shared cooldowns (ash-redis is shared with other services)
+COOLDOWN_KEY_PREFIX = "ash:alert_cooldown"
+
 
 # =============================================================================
 # Alert Type Enum
@@ -49,7 +71,7 @@ class AlertType(str, Enum):
 # =============================================================================
 # Data Classes
 # =============================================================================
-@dataclass
+@dataclass(slots=True)
 class StatusTransition:
     """Represents a status change for a component or connection."""
 
@@ -73,7 +95,7 @@ class StatusTransition:
         return self.alert_type == AlertType.RECOVERY
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertState:
     """
     Tracks the current state of all monitored entities.
@@ -86,14 +108,17 @@ class AlertState:
     connection_statuses: Dict[str, ComponentStatus] = field(default_factory=dict)
     ecosystem_status: ComponentStatus = ComponentStatus.HEALTHY
 
-    # Cooldown tracking (entity_name -> last alert timestamp)
-    last_alert_times: Dict[str, datetime] = field(default_factory=dict)
+    # Timestamps below are epoch seconds (time.time()); datetimes are only
+    # created for StatusTransitions that leave the manager
+
+    # Cooldown tracking ((entity_type, entity_name) -> last alert timestamp)
+    last_alert_times: Dict[Tuple[str, str], float] = field(default_factory=dict)
 
     # Downtime tracking (entity_name -> when it went down)
-    downtime_start: Dict[str, datetime] = field(default_factory=dict)
+    downtime_start: Dict[str, float] = field(default_factory=dict)
 
     # Last health check timestamp
-    last_check_time: Optional[datetime] = None
+    last_check_time: Optional[float] = None
 
     # Flag to indicate if initial state has been established
     initialized: bool = False
@@ -112,12 +137,30 @@ class AlertManager:
         - Implements cooldown to prevent alert spam
         - Calculates downtime duration for recovery alerts
         - Supports configurable alert thresholds
+
+    State is held in process memory, so with multiple server workers only
+    the background-leader worker may own an AlertManager (see
+    acquire_background_leader in main.py). Cooldowns can additionally be
+    shared through Redis: the first replica to claim an entity's cooldown key
+    (SET NX EX) sends the alert, the rest skip it. If Redis errors, the
+    in-process cooldowns are used instead.
     """
 
+    # Status groupings for downtime tracking, built once per class
+    _HEALTHY_STATUSES = frozenset({ComponentStatus.HEALTHY, ComponentStatus.DISABLED})
+    _UNHEALTHY_STATUSES = frozenset(
+        {
+            ComponentStatus.DEGRADED,
+            ComponentStatus.UNHEALTHY,
+            ComponentStatus.UNREACHABLE,
+        }
+    )
+
     def __init__(
         self,
         config_manager: ConfigManager,
         logger: LoggingConfigManager,
+        redis_client: Optional["Redis"] = None,
     ):
         """
         Initialize the Alert Manager.
@@ -125,10 +168,12 @@ class AlertManager:
         Args:
             config_manager: Configuration manager instance
             logger: Logging manager instance
+            redis_client: Optional Redis client for cooldowns shared across replicas
         """
         self._config = config_manager
         self._logger = logger
         self._log = logger.get_logger("alerting")
+        self._redis = redis_client
 
         # Initialize state
         self._state = AlertState()
@@ -160,18 +205,22 @@ class AlertManager:
         # Store component statuses
         for comp_key, comp_data in health.components.items():
             status_str = comp_data.get("status", "healthy")
-            self._state.component_statuses[comp_key] = ComponentStatus(status_str)
+            self._state.component_statuses[comp_key] = _STATUS_CACHE.get(
+                status_str, ComponentStatus.HEALTHY
+            )
 
         # Store connection statuses
         for conn_name, conn_data in health.connections.items():
             status_str = conn_data.get("status", "healthy")
-            self._state.connection_statuses[conn_name] = ComponentStatus(status_str)
+            self._state.connection_statuses[conn_name] = _STATUS_CACHE.get(
+                status_str, ComponentStatus.HEALTHY
+            )
 
         # Store ecosystem status
         self._state.ecosystem_status = health.status
 
         # Mark as initialized
-        self._state.last_check_time = datetime.now(timezone.utc)
+        self._state.last_check_time = time.time()
         self._state.initialized = True
 
         self._log.info(
@@ -196,14 +245,19 @@ class AlertManager:
             return []
 
         transitions: List[StatusTransition] = []
-        now = datetime.now(timezone.utc)
+        now = time.time()
 
-        # Check component transitions
+        # Check component transitions. Most checks change nothing, so the raw
+        # status string is compared first and only coerced when it differs.
         for comp_key, comp_data in current_health.components.items():
-            current_status = ComponentStatus(comp_data.get("status", "healthy"))
+            status_str = comp_data.get("status", "healthy")
             previous_status = self._state.component_statuses.get(
                 comp_key, ComponentStatus.HEALTHY
             )
+            if status_str == previous_status.value:
+                continue
+
+            current_status = _STATUS_CACHE.get(status_str, ComponentStatus.HEALTHY)
 
             if current_status != previous_status:
                 transition = self._create_transition(
@@ -227,10 +281,14 @@ class AlertManager:
         # Check connection transitions (if configured)
         if self._alert_on_connection:
             for conn_name, conn_data in current_health.connections.items():
-                current_status = ComponentStatus(conn_data.get("status", "healthy"))
+                status_str = conn_data.get("status", "healthy")
                 previous_status = self._state.connection_statuses.get(
                     conn_name, ComponentStatus.HEALTHY
                 )
+                if status_str == previous_status.value:
+                    continue
+
+                current_status = _STATUS_CACHE.get(status_str, ComponentStatus.HEALTHY)
 
                 if current_status != previous_status:
                     transition = self._create_transition(
@@ -280,7 +338,7 @@ class AlertManager:
         entity_name: str,
         from_status: ComponentStatus,
         to_status: ComponentStatus,
-        timestamp: datetime,
+        timestamp: float,
         error: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
     ) -> Optional[StatusTransition]:
@@ -292,7 +350,7 @@ class AlertManager:
             entity_name: Name of the entity
             from_status: Previous status
             to_status: New status
-            timestamp: When the transition occurred
+            timestamp: When the transition occurred (epoch seconds)
             error: Error message if applicable
             details: Additional details
 
@@ -303,24 +361,22 @@ class AlertManager:
 
         # Check if we should generate this alert based on configuration
         if alert_type == AlertType.WARNING and not self._alert_on_degraded:
-            self._log.debug(
-                f"Skipping degraded alert for {entity_name} (alerts disabled)"
-            )
+            self._log.debug("Skipping degraded alert for %s (alerts disabled)", entity_name)
             return None
 
         if alert_type == AlertType.RECOVERY and not self._alert_on_recovery:
-            self._log.debug(
-                f"Skipping recovery alert for {entity_name} (alerts disabled)"
-            )
+            self._log.debug("Skipping recovery alert for %s (alerts disabled)", entity_name)
             return None
 
-        # Add downtime duration for recovery alerts
-        if details is None:
-            details = {}
+        # Copy the details: they come straight from the health result, which
+        # is also stored as a metrics snapshot (and shared with API callers),
+        # so alert-only fields must never be written back into it
+        details = {} if details is None else dict(details)
 
+        # Add downtime duration for recovery alerts
         if alert_type == AlertType.RECOVERY and entity_name in self._state.downtime_start:
             downtime_start = self._state.downtime_start[entity_name]
-            downtime_seconds = (timestamp - downtime_start).total_seconds()
+            downtime_seconds = timestamp - downtime_start
             details["downtime_seconds"] = int(downtime_seconds)
             details["downtime_formatted"] = self._format_duration(downtime_seconds)
 
@@ -329,7 +385,7 @@ class AlertManager:
             entity_name=entity_name,
             from_status=from_status,
             to_status=to_status,
-            timestamp=timestamp,
+            timestamp=datetime.fromtimestamp(timestamp, timezone.utc),
             alert_type=alert_type,
             error=error,
             details=details,
@@ -368,7 +424,7 @@ class AlertManager:
         entity_name: str,
         from_status: ComponentStatus,
         to_status: ComponentStatus,
-        timestamp: datetime,
+        timestamp: float,
     ) -> None:
         """
         Update downtime tracking for an entity.
@@ -377,33 +433,38 @@ class AlertManager:
             entity_name: Name of the entity
             from_status: Previous status
             to_status: New status
-            timestamp: When the transition occurred
+            timestamp: When the transition occurred (epoch seconds)
         """
-        healthy_statuses = (ComponentStatus.HEALTHY, ComponentStatus.DISABLED)
-        unhealthy_statuses = (
-            ComponentStatus.DEGRADED,
-            ComponentStatus.UNHEALTHY,
-            ComponentStatus.UNREACHABLE,
-        )
+        healthy_statuses = self._HEALTHY_STATUSES
+        unhealthy_statuses = self._UNHEALTHY_STATUSES
 
         # Started being unhealthy
         if from_status in healthy_statuses and to_status in unhealthy_statuses:
             self._state.downtime_start[entity_name] = timestamp
-            self._log.debug(f"📉 Started tracking downtime for {entity_name}")
+            self._log.debug("📉 Started tracking downtime for %s", entity_name)
 
         # Recovered
         elif from_status in unhealthy_statuses and to_status in healthy_statuses:
             if entity_name in self._state.downtime_start:
                 del self._state.downtime_start[entity_name]
-                self._log.debug(f"📈 Cleared downtime tracking for {entity_name}")
+                self._log.debug("📈 Cleared downtime tracking for %s", entity_name)
+
+    @staticmethod
+    def _cooldown_key(transition: StatusTransition) -> str:
+        """Build the shared Redis cooldown key for a transition's entity."""
+        return f"{COOLDOWN_KEY_PREFIX}:{transition.entity_type}:{transition.entity_name}"
 
-    def should_alert(self, transition: StatusTransition) -> bool:
+    async def should_alert(self, transition: StatusTransition) -> bool:
         """
         Check if an alert should be sent based on cooldown.
 
         Recovery alerts ALWAYS bypass cooldown - when something comes back up,
         we want to know immediately regardless of when the last alert was sent.
 
+        With Redis, the check also claims the cooldown atomically, so only one
+        replica gets True for the same entity within the cooldown window. Call
+        release_alert() if the alert then fails to send.
+
         Args:
             transition: The transition to check
 
@@ -413,37 +474,94 @@ class AlertManager:
         # Recovery alerts ALWAYS bypass cooldown
         if transition.is_recovery:
             self._log.debug(
-                f"✅ Recovery alert for {transition.entity_name} bypasses cooldown"
+                "✅ Recovery alert for %s bypasses cooldown", transition.entity_name
             )
             return True
 
-        entity_key = f"{transition.entity_type}:{transition.entity_name}"
+        if self._redis is not None:
+            try:
+                claimed = await self._redis.set(
+                    self._cooldown_key(transition),
+                    transition.timestamp.isoformat(),
+                    nx=True,
+                    ex=self._cooldown_seconds,
+                )
+            except Exception as e:
+                self._log.warning("⚠️ Redis cooldown check failed, using in-process state: %s", e)
+            else:
+                if not claimed:
+                    self._log.debug(
+                        "⏳ Alert for %s:%s in cooldown (claimed in Redis)",
+                        transition.entity_type,
+                        transition.entity_name,
+                    )
+                return bool(claimed)
+
+        entity_key = (transition.entity_type, transition.entity_name)
         last_alert = self._state.last_alert_times.get(entity_key)
 
         if last_alert is None:
             return True
 
-        elapsed = (transition.timestamp - last_alert).total_seconds()
+        elapsed = transition.timestamp.timestamp() - last_alert
 
         if elapsed < self._cooldown_seconds:
             self._log.debug(
-                f"⏳ Alert for {entity_key} in cooldown "
-                f"({elapsed:.0f}s < {self._cooldown_seconds}s)"
+                "⏳ Alert for %s:%s in cooldown (%.0fs < %ss)",
+                transition.entity_type,
+                transition.entity_name,
+                elapsed,
+                self._cooldown_seconds,
             )
             return False
 
         return True
 
-    def record_alert_sent(self, transition: StatusTransition) -> None:
+    async def record_alert_sent(self, transition: StatusTransition) -> None:
         """
         Record that an alert was sent for cooldown tracking.
 
         Args:
             transition: The transition that was alerted on
         """
-        entity_key = f"{transition.entity_type}:{transition.entity_name}"
-        self._state.last_alert_times[entity_key] = transition.timestamp
-        self._log.debug(f"📝 Recorded alert time for {entity_key}")
+        self._state.last_alert_times[
+            (transition.entity_type, transition.entity_name)
+        ] = transition.timestamp.timestamp()
+        self._log.debug(
+            "📝 Recorded alert time for %s:%s",
+            transition.entity_type,
+            transition.entity_name,
+        )
+
+        # Other alerts already claimed their key in should_alert(); a recovery
+        # bypassed it, so (re)start the shared cooldown here as well
+        if self._redis is not None and transition.is_recovery:
+            try:
+                await self._redis.set(
+                    self._cooldown_key(transition),
+                    transition.timestamp.isoformat(),
+                    ex=self._cooldown_seconds,
+                )
+            except Exception as e:
+                self._log.warning("⚠️ Redis cooldown update failed: %s", e)
+
+    async def release_alert(self, transition: StatusTransition) -> None:
+        """
+        Give up a cooldown claimed by should_alert() for an alert that failed.
+
+        Without this, a failed send would still silence the entity in Redis
+        for the whole cooldown window.
+
+        Args:
+            transition: The transition whose alert was not delivered
+        """
+        if self._redis is None or transition.is_recovery:
+            return
+
+        try:
+            await self._redis.delete(self._cooldown_key(transition))
+        except Exception as e:
+            self._log.warning("⚠️ Redis cooldown release failed: %s", e)
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
@@ -456,18 +574,18 @@ class AlertManager:
         Returns:
             Formatted string (e.g., "5 mins", "2 hours 15 mins")
         """
-        if seconds < 60:
-            return f"{int(seconds)} secs"
-        elif seconds < 3600:
-            mins = int(seconds // 60)
-            return f"{mins} min{'s' if mins != 1 else ''}"
-        else:
-            hours = int(seconds // 3600)
-            mins = int((seconds % 3600) // 60)
-            result = f"{hours} hour{'s' if hours != 1 else ''}"
-            if mins > 0:
-                result += f" {mins} min{'s' if mins != 1 else ''}"
-            return result
+        total = int(seconds)
+        if total < 60:
+            return f"{total} secs"
+
+        hours, remainder = divmod(total, 3600)
+        mins = remainder // 60
+        mins_part = f"{mins} min{_PLURAL_SUFFIX[mins != 1]}"
+        if hours == 0:
+            return mins_part
+
+        hours_part = f"{hours} hour{_PLURAL_SUFFIX[hours != 1]}"
+        return f"{hours_part} {mins_part}" if mins > 0 else hours_part
 
     @property
     def is_initialized(self) -> bool:
@@ -486,6 +604,7 @@ class AlertManager:
 def create_alert_manager(
     config_manager: ConfigManager,
     logger: LoggingConfigManager,
+    redis_client: Optional["Redis"] = None,
 ) -> AlertManager:
     """
     Factory function to create an AlertManager instance.
@@ -493,6 +612,7 @@ def create_alert_manager(
     Args:
         config_manager: Configuration manager instance
         logger: Logging manager instance
+        redis_client: Optional Redis client for shared cooldowns
 
     Returns:
         Configured AlertManager instance
@@ -500,6 +620,7 @@ def create_alert_manager(
     return AlertManager(
         config_manager=config_manager,
         logger=logger,
+        redis_client=redis_client,
     )
 
 
@@ -22,11 +22,18 @@ Repository: https://github.com/the-alphabet-cartel/ash
 """
 
 import asyncio
+import functools
+import heapq
+import itertools
+import random
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import httpx
+import orjson
 
 from src.managers.alerting.alert_manager import AlertType, StatusTransition
 from src.managers.logging_config_manager import LoggingConfigManager
@@ -35,36 +42,107 @@ from src.managers.logging_config_manager import LoggingConfigManager
 # =============================================================================
 # Constants
 # =============================================================================
+# Lookup tables are read-only views so no caller can mutate them at runtime
+
 # Discord embed colors (decimal values)
-COLORS = {
+COLORS = MappingProxyType({
     AlertType.CRITICAL: 0xFF0000,  # Red
     AlertType.WARNING: 0xFFAA00,   # Orange/Yellow
     AlertType.RECOVERY: 0x00FF00,  # Green
     AlertType.INFO: 0x0099FF,      # Blue
-}
+})
 
 # Discord embed emojis
-EMOJIS = {
+EMOJIS = MappingProxyType({
     AlertType.CRITICAL: "🔴",
     AlertType.WARNING: "⚠️",
     AlertType.RECOVERY: "🟢",
     AlertType.INFO: "ℹ️",
-}
+})
+
+# (color, emoji) per alert type, so an embed needs a single lookup
+EMBED_STYLES = MappingProxyType({
+    alert_type: (COLORS[alert_type], EMOJIS[alert_type]) for alert_type in AlertType
+})
+DEFAULT_EMBED_STYLE = (0x808080, "📢")
+
+# Ecosystem summary (color, title) keyed by (has_critical, has_recovery);
+# a critical transition wins regardless of recoveries
+def _summary_style(alert_type: AlertType, suffix: str) -> Tuple[int, str]:
+    """Build the (color, title) pair for an ecosystem summary embed."""
+    color, emoji = EMBED_STYLES[alert_type]
+    return color, f"{emoji} Ecosystem Alert: {suffix}"
+
+
+SUMMARY_STYLES = MappingProxyType({
+    (True, True): _summary_style(AlertType.CRITICAL, "Multiple Issues Detected"),
+    (True, False): _summary_style(AlertType.CRITICAL, "Multiple Issues Detected"),
+    (False, True): _summary_style(AlertType.RECOVERY, "Services Recovering"),
+    (False, False): _summary_style(AlertType.WARNING, "Status Changes"),
+})
 
 # Component display names
-COMPONENT_NAMES = {
+COMPONENT_NAMES = MappingProxyType({
     "ash_bot": "Ash-Bot",
     "ash_nlp": "Ash-NLP",
     "ash_dash": "Ash-Dash",
     "ash_vault": "Ash-Vault",
     "ash_thrash": "Ash-Thrash",
     "ash": "Ash (Core)",
-}
+})
+
+# Send queue priorities (lower is sent first)
+PRIORITIES = MappingProxyType({
+    AlertType.CRITICAL: 0,
+    AlertType.RECOVERY: 1,
+    AlertType.WARNING: 2,
+    AlertType.INFO: 3,
+})
+
+# Request headers for pre-serialized (orjson) webhook bodies
+JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
 
 # Docker secrets path
 SECRETS_PATH = Path("/run/secrets")
 
 
+# =============================================================================
+# Logging
+# =============================================================================
+def _noop_log(msg: str, *args: Any) -> None:
+    """Stand-in for logger methods when no logger is configured."""
+
+
+# =============================================================================
+# Display Names
+# =============================================================================
+@functools.lru_cache(maxsize=256)
+def _display_name(entity_name: str) -> str:
+    """
+    Get a human-readable display name for an entity (memoized).
+
+    Safe to cache: COMPONENT_NAMES is a read-only module constant and the
+    set of entity names seen at runtime is small and fixed.
+
+    Args:
+        entity_name: Internal entity name
+
+    Returns:
+        Display name
+    """
+    # Check component names mapping (single lookup)
+    display_name = COMPONENT_NAMES.get(entity_name)
+    if display_name is not None:
+        return display_name
+
+    # Handle connection names (e.g., "ash-bot -> ash-nlp")
+    if " -> " in entity_name:
+        return entity_name  # Already readable
+
+    # Capitalize and replace underscores
+    return entity_name.replace("_", "-").title()
+
+
 # =============================================================================
 # Webhook URL Loader
 # =============================================================================
@@ -109,17 +187,49 @@ class DiscordWebhookSender:
         - Retry logic with exponential backoff
         - Rate limit handling
         - Graceful error handling
+        - Persistent HTTP client (connection/TLS reuse across alerts)
+        - Bounded priority send queue (critical alerts first, one at a time)
+
+    Every webhook POST goes through a single background worker, so bursts
+    are sent in priority order at the pace Discord's rate limit allows
+    instead of all at once. When the queue is full, the lowest-priority
+    message (queued or new) is dropped.
     """
 
     # Retry configuration
     MAX_RETRIES = 3
     BASE_RETRY_DELAY = 1.0  # seconds
+    MAX_RETRY_DELAY = 30.0  # seconds
+    RATE_LIMIT_JITTER_SECONDS = 0.5
     TIMEOUT_SECONDS = 10.0
+    MAX_CONNECTIONS = 20
+    MAX_KEEPALIVE_CONNECTIONS = 4
+    KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+    # Send queue configuration
+    MAX_QUEUE_SIZE = 100
+
+    # Non-critical alerts from one batch are coalesced into a single summary
+    # message once there are at least this many
+    SUMMARY_MIN_TRANSITIONS = 2
+
+    # Embed parts shared by every message. Payloads are serialized as soon as
+    # they are posted, so the footer dict is safely reused by reference.
+    _FOOTER = {"text": "Ash Ecosystem Health Monitor"}
+    _DEFAULT_TITLE_TEMPLATE = "{emoji} {name} Status Change"
+    _TITLE_TEMPLATES = MappingProxyType({
+        AlertType.RECOVERY: "{emoji} {name} Recovered",
+        AlertType.CRITICAL: _DEFAULT_TITLE_TEMPLATE,
+        AlertType.WARNING: _DEFAULT_TITLE_TEMPLATE,
+        AlertType.INFO: _DEFAULT_TITLE_TEMPLATE,
+    })
+    _SUMMARY_LINE = "{emoji} **{name}**: {src} → {dst}"
 
     def __init__(
         self,
         webhook_url: Optional[str] = None,
         logger: Optional[LoggingConfigManager] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the Discord webhook sender.
@@ -127,35 +237,126 @@ class DiscordWebhookSender:
         Args:
             webhook_url: Discord webhook URL (loaded from secrets if not provided)
             logger: Optional logging manager instance
+            client: Optional shared HTTP client (created lazily if not provided)
         """
         self._webhook_url = webhook_url or load_webhook_url()
         self._logger = logger
         self._log = logger.get_logger("discord_webhook") if logger else None
 
+        # Log helpers are bound once: the logger's own methods, or a no-op
+        # when running without a logger (no per-call None check)
+        log = self._log
+        self._log_info = log.info if log else _noop_log
+        self._log_warning = log.warning if log else _noop_log
+        self._log_error = log.error if log else _noop_log
+        self._log_debug = log.debug if log else _noop_log
+
+        # Only close the client on shutdown if we created it
+        self._client = client
+        self._owns_client = client is None
+
+        # Monotonic time before which no request may be sent (rate limit
+        # bucket exhausted or 429); shared by concurrent sends
+        self._rate_limited_until = 0.0
+
+        # Send queue: heap of (priority, sequence, payload, result future);
+        # the sequence keeps FIFO order within a priority
+        self._queue: List[Tuple[int, int, Dict[str, Any], asyncio.Future]] = []
+        self._queue_sequence = itertools.count()
+        self._queue_ready = asyncio.Event()
+        self._worker_task: Optional[asyncio.Task] = None
+
         if self._webhook_url:
             self._log_info("✅ Discord webhook configured")
         else:
             self._log_warning("⚠️ No Discord webhook URL configured - alerts disabled")
 
-    def _log_info(self, message: str) -> None:
-        """Log info message if logger is available."""
-        if self._log:
-            self._log.info(message)
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the persistent HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+        return self._client
 
-    def _log_warning(self, message: str) -> None:
-        """Log warning message if logger is available."""
-        if self._log:
-            self._log.warning(message)
+    def _enqueue(self, priority: int, payload: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a payload for the send worker.
 
-    def _log_error(self, message: str) -> None:
-        """Log error message if logger is available."""
-        if self._log:
-            self._log.error(message)
+        Returns:
+            Future resolved with True/False once the payload is sent, fails,
+            or is dropped because the queue is full
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        if len(self._queue) >= self.MAX_QUEUE_SIZE:
+            worst = max(self._queue)
+            if priority >= worst[0]:
+                self._log_warning("⚠️ Discord send queue full - dropping new alert")
+                future.set_result(False)
+                return future
+
+            # Make room by dropping the lowest-priority (newest) queued item
+            self._queue.remove(worst)
+            heapq.heapify(self._queue)
+            worst[3].set_result(False)
+            self._log_warning("⚠️ Discord send queue full - dropped a lower-priority alert")
+
+        heapq.heappush(self._queue, (priority, next(self._queue_sequence), payload, future))
+        self._queue_ready.set()
+
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(
+                self._send_worker(), name="discord_webhook_sender"
+            )
+        return future
+
+    async def _send_worker(self) -> None:
+        """Send queued payloads one at a time, highest priority first."""
+        while True:
+            while not self._queue:
+                self._queue_ready.clear()
+                await self._queue_ready.wait()
+
+            _, _, payload, future = heapq.heappop(self._queue)
+            if future.done():
+                # Caller gave up waiting (cancelled)
+                continue
 
-    def _log_debug(self, message: str) -> None:
-        """Log debug message if logger is available."""
-        if self._log:
-            self._log.debug(message)
+            try:
+                result = await self._send_with_retry(payload)
+            except Exception as e:
+                self._log_error(f"❌ Discord send worker error: {e}")
+                result = False
+
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the send worker and close the HTTP client if this sender owns it."""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+
+        # Anything still queued at shutdown is reported as not sent
+        for _, _, _, future in self._queue:
+            if not future.done():
+                future.set_result(False)
+        self._queue.clear()
+
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+            self._log_debug("🔌 Discord webhook client closed")
 
     @property
     def is_configured(self) -> bool:
@@ -180,8 +381,57 @@ class DiscordWebhookSender:
         embed = self._build_embed(transition)
         payload = {"embeds": [embed]}
 
-        # Send with retry logic
-        return await self._send_with_retry(payload)
+        # Queue for the send worker (which applies retry logic)
+        return await self._enqueue(PRIORITIES.get(transition.alert_type, 3), payload)
+
+    async def send_alerts(
+        self,
+        transitions: Sequence[StatusTransition],
+        ecosystem_status: Optional[str] = None,
+    ) -> List[Union[bool, BaseException]]:
+        """
+        Queue alerts for several transitions and wait for all of them.
+
+        Critical alerts are always sent individually, with full details. The
+        remaining transitions are coalesced into one send_ecosystem_summary
+        message when there are SUMMARY_MIN_TRANSITIONS or more, so a burst
+        costs one webhook request instead of one per transition. The send
+        worker delivers messages highest priority first, pacing them by
+        Discord's rate limit.
+
+        Args:
+            transitions: The status transitions to alert on (one batch)
+            ecosystem_status: Current ecosystem status for the summary
+
+        Returns:
+            One result per transition, in order: True/False from sending its
+            message, or the exception raised
+        """
+        if not transitions:
+            return []
+
+        individual = [t for t in transitions if t.is_critical]
+        batched = [t for t in transitions if not t.is_critical]
+        if len(batched) < self.SUMMARY_MIN_TRANSITIONS:
+            individual, batched = list(transitions), []
+
+        sends = [self.send_alert(t) for t in individual]
+        if batched:
+            sends.append(
+                self.send_ecosystem_summary(batched, ecosystem_status or "unknown")
+            )
+
+        outcomes = await asyncio.gather(*sends, return_exceptions=True)
+
+        # Every coalesced transition shares the summary's result
+        results: Dict[int, Union[bool, BaseException]] = {
+            id(t): outcome for t, outcome in zip(individual, outcomes)
+        }
+        if batched:
+            for t in batched:
+                results[id(t)] = outcomes[-1]
+
+        return [results[id(t)] for t in transitions]
 
     def _build_embed(self, transition: StatusTransition) -> Dict[str, Any]:
         """
@@ -194,17 +444,15 @@ class DiscordWebhookSender:
             Discord embed dictionary
         """
         alert_type = transition.alert_type
-        emoji = EMOJIS.get(alert_type, "📢")
-        color = COLORS.get(alert_type, 0x808080)
+        color, emoji = EMBED_STYLES.get(alert_type, DEFAULT_EMBED_STYLE)
 
         # Get display name for the entity
         display_name = self._get_display_name(transition.entity_name)
 
         # Build title based on alert type
-        if alert_type == AlertType.RECOVERY:
-            title = f"{emoji} {display_name} Recovered"
-        else:
-            title = f"{emoji} {display_name} Status Change"
+        title = self._TITLE_TEMPLATES.get(
+            alert_type, self._DEFAULT_TITLE_TEMPLATE
+        ).format(emoji=emoji, name=display_name)
 
         # Build description
         description = (
@@ -260,9 +508,7 @@ class DiscordWebhookSender:
             "description": description,
             "color": color,
             "fields": fields,
-            "footer": {
-                "text": "Ash Ecosystem Health Monitor",
-            },
+            "footer": self._FOOTER,
             "timestamp": transition.timestamp.isoformat(),
         }
 
@@ -278,16 +524,52 @@ class DiscordWebhookSender:
         Returns:
             Display name
         """
-        # Check component names mapping
-        if entity_name in COMPONENT_NAMES:
-            return COMPONENT_NAMES[entity_name]
+        return _display_name(entity_name)
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Sleep until the current rate limit window (if any) has reset."""
+        delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            self._log_debug("⏳ Waiting %.2fs for Discord rate limit reset", delay)
+            await asyncio.sleep(delay)
+
+    def _defer_until(self, delay_seconds: float) -> None:
+        """Hold further requests for delay_seconds (never shortens a wait)."""
+        self._rate_limited_until = max(
+            self._rate_limited_until, time.monotonic() + delay_seconds
+        )
 
-        # Handle connection names (e.g., "ash-bot -> ash-nlp")
-        if " -> " in entity_name:
-            return entity_name  # Already readable
+    def _track_rate_limit(self, response: httpx.Response) -> None:
+        """
+        Honor Discord's rate limit headers, which come on every response.
 
-        # Capitalize and replace underscores
-        return entity_name.replace("_", "-").title()
+        When the bucket is exhausted (X-RateLimit-Remaining: 0), the next
+        request waits X-RateLimit-Reset-After seconds instead of running into
+        a 429 first.
+        """
+        headers = response.headers
+        if headers.get("X-RateLimit-Remaining") != "0":
+            return
+
+        try:
+            self._defer_until(float(headers.get("X-RateLimit-Reset-After", "0")))
+        except ValueError:
+            pass
+
+    def _retry_after_seconds(self, response: httpx.Response) -> float:
+        """Get the 429 wait, preferring headers over decoding the JSON body."""
+        for header in ("X-RateLimit-Reset-After", "Retry-After"):
+            value = response.headers.get(header)
+            if value is not None:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+
+        try:
+            return float(response.json().get("retry_after", 5))
+        except Exception:
+            return 5.0
 
     async def _send_with_retry(self, payload: Dict[str, Any]) -> bool:
         """
@@ -299,32 +581,43 @@ class DiscordWebhookSender:
         Returns:
             True if successful, False otherwise
         """
+        # Serialized once; every retry re-posts the same bytes
+        body = orjson.dumps(payload)
+
         for attempt in range(self.MAX_RETRIES):
             try:
-                async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-                    response = await client.post(
-                        self._webhook_url,
-                        json=payload,
+                await self._wait_for_rate_limit()
+
+                response = await self._get_client().post(
+                    self._webhook_url,
+                    content=body,
+                    headers=JSON_HEADERS,
+                    timeout=self.TIMEOUT_SECONDS,
+                )
+                self._track_rate_limit(response)
+                status = response.status_code
+
+                # Success (204 No Content is expected, so it is checked first)
+                if status == 204 or status == 200:
+                    self._log_debug("✅ Discord alert sent successfully")
+                    return True
+
+                # Rate limited
+                if status == 429:
+                    # Jittered so concurrent senders don't all retry at once;
+                    # the wait happens at the top of the next attempt
+                    retry_after = self._retry_after_seconds(response)
+                    retry_after += random.uniform(0, self.RATE_LIMIT_JITTER_SECONDS)
+                    self._log_warning(
+                        f"⏳ Discord rate limited, waiting {retry_after:.2f}s..."
                     )
+                    self._defer_until(retry_after)
+                    continue
 
-                    # Success (204 No Content is expected)
-                    if response.status_code in (200, 204):
-                        self._log_debug("✅ Discord alert sent successfully")
-                        return True
-
-                    # Rate limited
-                    if response.status_code == 429:
-                        retry_after = response.json().get("retry_after", 5)
-                        self._log_warning(
-                            f"⏳ Discord rate limited, waiting {retry_after}s..."
-                        )
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    # Other error
-                    self._log_error(
-                        f"❌ Discord webhook error: HTTP {response.status_code}"
-                    )
+                # Other error
+                self._log_error(
+                    f"❌ Discord webhook error: HTTP {status}"
+                )
 
             except httpx.TimeoutException:
                 self._log_warning(f"⏱️ Discord webhook timeout (attempt {attempt + 1})")
@@ -332,10 +625,18 @@ class DiscordWebhookSender:
             except Exception as e:
                 self._log_error(f"❌ Discord webhook error: {e}")
 
-            # Exponential backoff before retry
+            # Jittered exponential backoff before retry: alerts that failed
+            # together (e.g. during an outage) spread their retries out
+            # instead of hitting Discord at the same instants
             if attempt < self.MAX_RETRIES - 1:
-                delay = self.BASE_RETRY_DELAY * (2 ** attempt)
-                self._log_debug(f"Retrying in {delay}s...")
+                delay = min(
+                    self.MAX_RETRY_DELAY,
+                    random.uniform(
+                        self.BASE_RETRY_DELAY,
+                        self.BASE_RETRY_DELAY * (2 ** (attempt + 1)),
+                    ),
+                )
+                self._log_debug("Retrying in %.2fs...", delay)
                 await asyncio.sleep(delay)
 
         self._log_error(f"❌ Failed to send Discord alert after {self.MAX_RETRIES} attempts")
@@ -364,35 +665,33 @@ class DiscordWebhookSender:
         if not transitions:
             return True
 
-        # Determine severity based on transitions
-        has_critical = any(t.is_critical for t in transitions)
-        has_recovery = any(t.is_recovery for t in transitions)
-
-        if has_critical:
-            color = COLORS[AlertType.CRITICAL]
-            emoji = EMOJIS[AlertType.CRITICAL]
-            title = f"{emoji} Ecosystem Alert: Multiple Issues Detected"
-        elif has_recovery:
-            color = COLORS[AlertType.RECOVERY]
-            emoji = EMOJIS[AlertType.RECOVERY]
-            title = f"{emoji} Ecosystem Alert: Services Recovering"
-        else:
-            color = COLORS[AlertType.WARNING]
-            emoji = EMOJIS[AlertType.WARNING]
-            title = f"{emoji} Ecosystem Alert: Status Changes"
+        # Determine severity based on transitions (one pass; a critical
+        # transition decides the outcome, so stop at the first one)
+        has_critical = has_recovery = False
+        for t in transitions:
+            if t.is_critical:
+                has_critical = True
+                break
+            has_recovery = has_recovery or t.is_recovery
+
+        color, title = SUMMARY_STYLES[(has_critical, has_recovery)]
 
         # Build summary description
-        description_lines = []
-        for t in transitions:
-            t_emoji = EMOJIS.get(t.alert_type, "•")
-            display_name = self._get_display_name(t.entity_name)
-            description_lines.append(
-                f"{t_emoji} **{display_name}**: {t.from_status.value} → {t.to_status.value}"
+        description = "\n".join(
+            self._SUMMARY_LINE.format(
+                emoji=EMBED_STYLES.get(t.alert_type, DEFAULT_EMBED_STYLE)[1],
+                name=self._get_display_name(t.entity_name),
+                src=t.from_status.value,
+                dst=t.to_status.value,
             )
+            for t in transitions
+        )
+
+        now = datetime.now(timezone.utc)
 
         embed = {
             "title": title,
-            "description": "\n".join(description_lines),
+            "description": description,
             "color": color,
             "fields": [
                 {
@@ -407,18 +706,17 @@ class DiscordWebhookSender:
                 },
                 {
                     "name": "Time",
-                    "value": f"<t:{int(datetime.now(timezone.utc).timestamp())}:R>",
+                    "value": f"<t:{int(now.timestamp())}:R>",
                     "inline": True,
                 },
             ],
-            "footer": {
-                "text": "Ash Ecosystem Health Monitor",
-            },
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "footer": self._FOOTER,
+            "timestamp": now.isoformat(),
         }
 
         payload = {"embeds": [embed]}
-        return await self._send_with_retry(payload)
+        priority = min(PRIORITIES.get(t.alert_type, 3) for t in transitions)
+        return await self._enqueue(priority, payload)
 
 
 # =============================================================================
@@ -427,6 +725,7 @@ class DiscordWebhookSender:
 def create_discord_webhook_sender(
     webhook_url: Optional[str] = None,
     logger: Optional[LoggingConfigManager] = None,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> DiscordWebhookSender:
     """
     Factory function to create a DiscordWebhookSender instance.
@@ -434,13 +733,18 @@ def create_discord_webhook_sender(
     Args:
         webhook_url: Discord webhook URL (loaded from secrets if not provided)
         logger: Optional logging manager instance
+        client: Optional shared HTTP client (created lazily if not provided)
 
     Returns:
         Configured DiscordWebhookSender instance
+
+    Note:
+        Call close() on shutdown to release the HTTP client.
     """
     return DiscordWebhookSender(
         webhook_url=webhook_url,
         logger=logger,
+        client=client,
     )
 
 
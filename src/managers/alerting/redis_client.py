@@ -0,0 +1,130 @@
+"""
+============================================================================
+Ash: Crisis Detection Ecosystem API
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Listen   → Maintain vigilant presence across all community spaces
+    Detect   → Identify mental health crisis patterns through comprehensive analysis
+    Connect  → Bridge community members to timely support and intervention
+    Protect  → Safeguard our LGBTQIA+ chosen family through early crisis response
+
+============================================================================
+Redis Client - Shared Alert Cooldown Storage
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-6-1.0-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 6 - Logging Colorization
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash
+============================================================================
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+
+# redis is optional: without it (or with Redis disabled/unreachable) alert
+# cooldowns stay in process memory
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - optional dependency
+    redis_asyncio = None
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+# Docker secrets path
+SECRETS_PATH = Path("/run/secrets")
+
+# Connect/command timeout - cooldown checks must never stall alerting
+REDIS_TIMEOUT_SECONDS = 2.0
+
+
+# =============================================================================
+# Password Loader
+# =============================================================================
+def load_redis_password(secret_name: str = "redis_token") -> Optional[str]:
+    """
+    Load the Redis password from Docker secrets.
+
+    Args:
+        secret_name: Name of the secret file containing the password
+
+    Returns:
+        Password string, or None if not found
+    """
+    for secret_path in (SECRETS_PATH / secret_name, Path("secrets") / secret_name):
+        if secret_path.exists():
+            try:
+                return secret_path.read_text().strip() or None
+            except Exception:
+                pass
+
+    return None
+
+
+# =============================================================================
+# Factory Function (Clean Architecture Rule #1)
+# =============================================================================
+async def create_redis_client(
+    config_manager: ConfigManager,
+    logger: LoggingConfigManager,
+) -> Optional["Redis"]:
+    """
+    Factory function to create the shared Redis client for alert cooldowns.
+
+    Returns None (in-process cooldowns) when Redis is disabled, the redis
+    package is not installed, or the server does not answer a PING.
+
+    Args:
+        config_manager: Configuration manager instance
+        logger: Logging manager instance
+
+    Returns:
+        Connected Redis client, or None
+    """
+    log = logger.get_logger("redis")
+
+    if not config_manager.redis_enabled:
+        return None
+
+    if redis_asyncio is None:
+        log.warning("⚠️ Redis enabled but the redis package is not installed - using in-process cooldowns")
+        return None
+
+    client = redis_asyncio.Redis(
+        host=config_manager.redis_host,
+        port=config_manager.redis_port,
+        db=config_manager.redis_db,
+        password=load_redis_password(),
+        socket_timeout=REDIS_TIMEOUT_SECONDS,
+        socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        decode_responses=True,
+    )
+
+    try:
+        await client.ping()
+    except Exception as e:
+        log.warning(f"⚠️ Redis unreachable ({e}) - using in-process cooldowns")
+        await client.aclose()
+        return None
+
+    log.info(
+        f"✅ Redis connected for shared alert cooldowns "
+        f"({config_manager.redis_host}:{config_manager.redis_port}/{config_manager.redis_db})"
+    )
+    return client
+
+
+__all__ = [
+    "create_redis_client",
+    "load_redis_password",
+]
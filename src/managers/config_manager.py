@@ -24,6 +24,7 @@ Repository: https://github.com/the-alphabet-cartel/ash
 import json
 import os
 import re
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -42,11 +43,23 @@ class ConfigManager:
         - Environment variables override JSON defaults (Rule #4)
         - Resilient validation with smart fallbacks (Rule #5)
         - Type coercion for environment variable strings
+        - Typed accessors are cached after first read (config is immutable)
     """
 
     # Regex pattern to detect environment variable placeholders
     ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
+    # Type coercion dispatch for environment variable strings
+    _BOOL_VALUES = {
+        "true": True, "yes": True, "1": True, "on": True,
+        "false": False, "no": False, "0": False, "off": False,
+    }
+    _INT_PATTERN = re.compile(r"[+-]?\d+")
+    _FLOAT_PATTERN = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?")
+
+    # Upper bound for the automatic worker count (server.workers = 0)
+    MAX_AUTO_WORKERS = 4
+
     def __init__(
         self,
         config_path: Optional[str] = None,
@@ -73,10 +86,25 @@ class ConfigManager:
         self._config_path = config_path
         self._raw_config: Dict[str, Any] = {}
         self._resolved_config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
 
         # Load configuration
         self._load_config()
 
+    def attach_logger(self, logger: LoggingConfigManager) -> None:
+        """
+        Route this manager's log output through the given logging manager.
+
+        Used when the shared instance was first created without a logger
+        (e.g. by create_app() at import time) and the lifespan later
+        supplies the application's logging manager.
+
+        Args:
+            logger: Logging manager instance
+        """
+        self._logger = logger
+        self._log = logger.get_logger("config_manager")
+
     def _load_config(self) -> None:
         """Load and resolve the JSON configuration file."""
         try:
@@ -104,6 +132,32 @@ class ConfigManager:
             self._log.error(f"❌ Failed to load config: {e}")
             self._raw_config = {}
             self._resolved_config = {}
+        finally:
+            # Rebuilt on every (re)load so get() never serves stale paths
+            self._flat = self._flatten_config(self._resolved_config)
+
+    @staticmethod
+    def _flatten_config(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        """
+        Flatten a resolved config tree into a dot-path lookup table.
+
+        Every path is recorded, including intermediate sections, so get()
+        on a section path still returns the whole dict.
+
+        Args:
+            config: Resolved configuration dictionary
+            prefix: Dot-separated path of ``config`` within the tree
+
+        Returns:
+            Dictionary mapping "section.key" paths to values
+        """
+        flat: Dict[str, Any] = {}
+        for key, value in config.items():
+            path = f"{prefix}.{key}" if prefix else key
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(ConfigManager._flatten_config(value, path))
+        return flat
 
     def _resolve_config(self, config: Any, path: str = "") -> Any:
         """
@@ -151,6 +205,11 @@ class ConfigManager:
         Returns:
             Resolved value (from env var or defaults)
         """
+        # Fast path: .match() only succeeds on strings that start with "${",
+        # which most config values (names, URLs, descriptions) do not
+        if not value.startswith("${"):
+            return value
+
         match = self.ENV_VAR_PATTERN.match(value)
         if not match:
             return value
@@ -173,21 +232,23 @@ class ConfigManager:
         self._log.warning(f"⚠️  No value for {env_var_name} and no default at {path}")
         return value
 
-    def _get_default_for_path(self, path: str) -> Any:
+    def _get_section_entry(self, path: str, section_key: str) -> Any:
         """
-        Get the default value for a configuration path.
+        Get a path's entry from a section-level block such as "defaults".
 
         Args:
             path: Dot-separated path like "server.host"
+            section_key: Block inside the containing section ("defaults",
+                "validation")
 
         Returns:
-            Default value if found, None otherwise
+            The entry for the path's last key if found, None otherwise
         """
         parts = path.split(".")
         if len(parts) < 2:
             return None
 
-        # Navigate to the section containing 'defaults'
+        # Navigate to the section containing the block
         section = self._raw_config
         for part in parts[:-1]:
             if isinstance(section, dict) and part in section:
@@ -195,13 +256,40 @@ class ConfigManager:
             else:
                 return None
 
-        # Look for 'defaults' in this section
-        if isinstance(section, dict) and "defaults" in section:
-            defaults = section["defaults"]
+        # Look for the block in this section
+        if isinstance(section, dict) and section_key in section:
+            block = section[section_key]
             key = parts[-1]
-            if isinstance(defaults, dict) and key in defaults:
-                return defaults[key]
+            if isinstance(block, dict) and key in block:
+                return block[key]
+
+        return None
+
+    def _get_default_for_path(self, path: str) -> Any:
+        """
+        Get the default value for a configuration path.
+
+        Args:
+            path: Dot-separated path like "server.host"
+
+        Returns:
+            Default value if found, None otherwise
+        """
+        return self._get_section_entry(path, "defaults")
+
+    def _get_declared_type(self, path: str) -> Optional[str]:
+        """
+        Get the type declared for a configuration path in its validation block.
 
+        Args:
+            path: Dot-separated path like "redis.db"
+
+        Returns:
+            Declared type ("integer", "string", ...) or None if not declared
+        """
+        rules = self._get_section_entry(path, "validation")
+        if isinstance(rules, dict):
+            return rules.get("type")
         return None
 
     def _coerce_type(self, value: str, path: str) -> Any:
@@ -215,23 +303,25 @@ class ConfigManager:
         Returns:
             Type-coerced value
         """
+        # A declared type wins over guessing, so "1" stays the integer 1 for
+        # integer settings (redis.db, server.workers, ...) instead of
+        # matching the boolean table, and string settings stay strings
+        declared_type = self._get_declared_type(path)
+        if declared_type == "integer" and self._INT_PATTERN.fullmatch(value):
+            return int(value)
+        if declared_type == "string":
+            return value
+
         # Check for boolean
-        if value.lower() in ("true", "yes", "1", "on"):
-            return True
-        if value.lower() in ("false", "no", "0", "off"):
-            return False
+        boolean = self._BOOL_VALUES.get(value.lower())
+        if boolean is not None:
+            return boolean
 
-        # Check for integer
-        try:
+        # Check for integer / float
+        if self._INT_PATTERN.fullmatch(value):
             return int(value)
-        except ValueError:
-            pass
-
-        # Check for float
-        try:
+        if self._FLOAT_PATTERN.fullmatch(value):
             return float(value)
-        except ValueError:
-            pass
 
         # Check for JSON (lists, dicts)
         if value.startswith(("[", "{")):
@@ -254,16 +344,7 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        parts = path.split(".")
-        value = self._resolved_config
-
-        for part in parts:
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return default
-
-        return value
+        return self._flat.get(path, default)
 
     def get_section(self, section: str) -> Dict[str, Any]:
         """
@@ -309,72 +390,118 @@ class ConfigManager:
         connections = self._resolved_config.get("connections", {})
         return connections.get("checks", [])
 
-    @property
+    @cached_property
     def server_host(self) -> str:
         """Get the server host address."""
         return self.get("server.host", "0.0.0.0")
 
-    @property
+    @cached_property
     def server_port(self) -> int:
         """Get the server port."""
         return self.get("server.port", 30887)
 
-    @property
+    @cached_property
+    def server_workers(self) -> int:
+        """
+        Get the number of server worker processes.
+
+        A value of 0 (the default) means auto: one per CPU core, capped at
+        MAX_AUTO_WORKERS. The API is I/O-bound, so more workers mostly add
+        memory and extra SQLite readers.
+        """
+        workers = self.get("server.workers", 0)
+        # bool subclasses int, so True/False must be rejected explicitly
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers <= 0:
+            return min(os.cpu_count() or 1, self.MAX_AUTO_WORKERS)
+        return int(workers)
+
+    @cached_property
+    def prometheus_enabled(self) -> bool:
+        """Get whether Prometheus request metrics are exposed at /prometheus."""
+        return self.get("server.prometheus_enabled", True)
+
+    @cached_property
     def environment(self) -> str:
         """Get the environment name."""
         return self.get("server.environment", "production")
 
-    @property
+    @cached_property
+    def cors_allowed_origins(self) -> frozenset:
+        """
+        Get the set of origins allowed to make cross-origin requests.
+
+        Accepts a JSON list or a comma-separated string from the environment.
+        """
+        origins = self.get("cors.allowed_origins", [])
+        if isinstance(origins, str):
+            origins = origins.split(",")
+        return frozenset(o.strip() for o in origins if o and o.strip())
+
+    @cached_property
+    def cors_allowed_origin_regex(self) -> Optional[str]:
+        """
+        Get the optional regex matching additional allowed origins.
+
+        Lets a growing set of origins be covered by one pattern (compiled once
+        by the CORS middleware) instead of an ever longer list. Empty means
+        disabled.
+        """
+        pattern = self.get("cors.allowed_origin_regex", "")
+        if not isinstance(pattern, str) or not pattern or self.ENV_VAR_PATTERN.match(pattern):
+            return None
+        return pattern
+
+    @cached_property
     def log_level(self) -> str:
         """Get the logging level."""
         return self.get("logging.level", "INFO")
 
-    @property
+    @cached_property
     def log_format(self) -> str:
         """Get the logging format."""
         return self.get("logging.format", "human")
 
-    @property
+    @cached_property
     def log_file(self) -> Optional[str]:
         """Get the log file path."""
         return self.get("logging.file")
 
-    @property
+    @cached_property
     def log_console(self) -> bool:
         """Get whether console logging is enabled."""
         return self.get("logging.console", True)
 
-    @property
+    @cached_property
     def check_timeout_ms(self) -> int:
         """Get the health check timeout in milliseconds."""
         return self.get("ecosystem.check_timeout_ms", 5000)
 
-    @property
+    @cached_property
     def alerting_enabled(self) -> bool:
         """Get whether alerting is enabled."""
         return self.get("alerting.enabled", True)
 
-    @property
+    @cached_property
     def alerting_check_interval_seconds(self) -> int:
         """Get the alerting check interval in seconds."""
         return self.get("alerting.check_interval_seconds", 60)
 
-    @property
+    @cached_property
     def alerting_cooldown_seconds(self) -> int:
         """Get the alerting cooldown in seconds (minimum time between alerts for same entity)."""
         return self.get("alerting.cooldown_seconds", 300)
 
-    @property
+    @cached_property
     def alerting_on_degraded(self) -> bool:
         """Get whether to alert when components become degraded."""
         return self.get("alerting.alert_on_degraded", True)
 
-    @property
+    @cached_property
     def alerting_on_recovery(self) -> bool:
         """Get whether to alert when components recover."""
         return self.get("alerting.alert_on_recovery", True)
 
-    @property
+    @cached_property
     def alerting_on_connection_issues(self) -> bool:
         """Get whether to alert on inter-component connection issues."""
         return self.get("alerting.alert_on_connection_issues", True)
@@ -382,40 +509,64 @@ class ConfigManager:
     # =========================================================================
     # Metrics Configuration (Phase 5)
     # =========================================================================
-    @property
+    @cached_property
     def metrics_enabled(self) -> bool:
         """Get whether historical metrics collection is enabled."""
         return self.get("metrics.enabled", True)
 
-    @property
+    @cached_property
     def metrics_db_path(self) -> str:
         """Get the SQLite database path for metrics storage."""
         return self.get("metrics.db_path", "/app/data/metrics.db")
 
-    @property
+    @cached_property
     def metrics_retention_snapshots_days(self) -> int:
         """Get the retention period for raw health snapshots (days)."""
         return self.get("metrics.retention_snapshots_days", 7)
 
-    @property
+    @cached_property
     def metrics_retention_incidents_days(self) -> int:
         """Get the retention period for incident records (days)."""
         return self.get("metrics.retention_incidents_days", 90)
 
-    @property
+    @cached_property
     def metrics_retention_aggregates_days(self) -> int:
         """Get the retention period for daily aggregates (days)."""
         return self.get("metrics.retention_aggregates_days", 365)
 
-    @property
+    @cached_property
     def metrics_maintenance_hour(self) -> int:
         """Get the hour (UTC) when daily maintenance should run."""
         return self.get("metrics.maintenance_hour", 3)
 
+    @cached_property
+    def redis_enabled(self) -> bool:
+        """Get whether alert cooldowns are shared through Redis."""
+        return self.get("redis.enabled", False)
+
+    @cached_property
+    def redis_host(self) -> str:
+        """Get the Redis hostname."""
+        return self.get("redis.host", "ash-redis")
+
+    @cached_property
+    def redis_port(self) -> int:
+        """Get the Redis port."""
+        return self.get("redis.port", 6379)
+
+    @cached_property
+    def redis_db(self) -> int:
+        """Get the Redis database number."""
+        return self.get("redis.db", 0)
+
 
 # =============================================================================
 # Factory Function (Clean Architecture Rule #1)
 # =============================================================================
+# Shared instance for the default config file (one load per process)
+_default_config_manager: Optional[ConfigManager] = None
+
+
 def create_config_manager(
     config_path: Optional[str] = None,
     logger: Optional[LoggingConfigManager] = None,
@@ -423,6 +574,13 @@ def create_config_manager(
     """
     Factory function to create a ConfigManager instance.
 
+    The default configuration (no config_path) is loaded once per process
+    and shared by every caller, so create_app(), the lifespan and the CLI
+    entry point do not parse and resolve the config twice. A logger passed
+    on a later call is attached to the shared instance, so its subsequent
+    output goes through the caller's logging setup. An explicit config_path
+    always creates a fresh instance.
+
     Args:
         config_path: Path to the JSON configuration file
         logger: Optional logging manager instance
@@ -430,7 +588,16 @@ def create_config_manager(
     Returns:
         Configured ConfigManager instance
     """
-    return ConfigManager(config_path=config_path, logger=logger)
+    global _default_config_manager
+
+    if config_path is not None:
+        return ConfigManager(config_path=config_path, logger=logger)
+
+    if _default_config_manager is None:
+        _default_config_manager = ConfigManager(logger=logger)
+    elif logger is not None:
+        _default_config_manager.attach_logger(logger)
+    return _default_config_manager
 
 
 __all__ = ["ConfigManager", "create_config_manager"]
@@ -26,9 +26,11 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
 from src.managers.config_manager import ConfigManager
 from src.managers.logging_config_manager import LoggingConfigManager
@@ -47,10 +49,11 @@ class ComponentStatus(str, Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComponentHealth:
     """Health status for a single ecosystem component."""
 
+    key: str  # Config key (e.g. "ash_bot"), used to index results
     name: str
     status: ComponentStatus
     endpoint: str
@@ -61,7 +64,7 @@ class ComponentHealth:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConnectionHealth:
     """Health status for an inter-component connection."""
 
@@ -72,9 +75,14 @@ class ConnectionHealth:
     critical: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EcosystemHealth:
-    """Aggregated health status for the entire ecosystem."""
+    """
+    Aggregated health status for the entire ecosystem.
+
+    Instances returned by check_ecosystem_health() are shared between
+    callers and must be treated as read-only (copy before modifying).
+    """
 
     ecosystem: str = "ash"
     status: ComponentStatus = ComponentStatus.HEALTHY
@@ -109,16 +117,41 @@ class EcosystemHealthManager:
         - Connection validation between components
         - Status aggregation and summary calculation
         - Resilient error handling (system doesn't crash on failures)
+        - Persistent HTTP client (connection reuse across health checks)
     """
 
     # Thresholds for status determination
     LATENCY_WARNING_MS = 1000  # Above this is "degraded"
     LATENCY_CRITICAL_MS = 5000  # Above this is "unhealthy"
 
+    # Self-reported statuses that override the latency check
+    _REPORTED_STATUSES = MappingProxyType({
+        "unhealthy": ComponentStatus.UNHEALTHY,
+        "degraded": ComponentStatus.DEGRADED,
+    })
+
+    # Indexed by the number of latency thresholds exceeded (0-2)
+    _LATENCY_STATUSES = (
+        ComponentStatus.HEALTHY,
+        ComponentStatus.DEGRADED,
+        ComponentStatus.UNHEALTHY,
+    )
+
+    # Upper bound on component checks in flight at once
+    MAX_CONCURRENT_CHECKS = 10
+
+    # Results newer than this are shared with callers instead of re-probing
+    RESULT_CACHE_TTL_SECONDS = 1.5
+
+    # Connection pool sizing for the health check HTTP client
+    MAX_CONNECTIONS = 50
+    MAX_KEEPALIVE_CONNECTIONS = 20
+
     def __init__(
         self,
         config_manager: ConfigManager,
         logger: LoggingConfigManager,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the Ecosystem Health Manager.
@@ -126,6 +159,7 @@ class EcosystemHealthManager:
         Args:
             config_manager: Configuration manager instance
             logger: Logging manager instance
+            client: Optional shared HTTP client (created lazily if not provided)
         """
         self._config = config_manager
         self._logger = logger
@@ -133,10 +167,105 @@ class EcosystemHealthManager:
 
         # HTTP client configuration
         self._timeout_seconds = self._config.check_timeout_ms / 1000.0
+        self._check_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHECKS)
+
+        # Only close the client on shutdown if we created it
+        self._client = client
+        self._owns_client = client is None
+
+        # Component entries and connection checks resolved once (config is
+        # immutable after load)
+        self._components = self._resolve_components()
+        self._connection_checks = self._config.get_connection_checks()
+
+        # Last result as (monotonic completion time, health) and the check
+        # currently in flight, shared by concurrent callers
+        self._cached_health: Optional[Tuple[float, EcosystemHealth]] = None
+        self._inflight: Optional[asyncio.Task] = None
 
         self._log.info("✅ EcosystemHealthManager initialized")
 
+    def _resolve_components(self) -> List[Tuple[str, str, str, bool]]:
+        """
+        Resolve the configured components into check entries.
+
+        Filtering of metadata keys and resolution of name, health URL and
+        enabled flag (with section defaults) happen here once instead of on
+        every health check.
+
+        Returns:
+            List of (key, name, health_url, enabled) tuples in configuration order
+        """
+        entries = []
+        for key, config in self._config.get_all_components().items():
+            # Skip non-component entries (like "description", "defaults", etc.)
+            if not isinstance(config, dict):
+                continue
+
+            # Skip metadata keys that might be dicts but aren't components
+            if key in ("description", "defaults", "validation", "_metadata"):
+                continue
+
+            defaults = config.get("defaults", {})
+            entries.append((
+                key,
+                config.get("name", key),
+                config.get("health_url", defaults.get("health_url", "")),
+                config.get("enabled", defaults.get("enabled", True)),
+            ))
+
+        return entries
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the persistent HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = create_health_check_client(self._timeout_seconds)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client if this manager owns it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+            self._log.debug("🔌 Health check client closed")
+
     async def check_ecosystem_health(self) -> EcosystemHealth:
+        """
+        Get the current ecosystem health.
+
+        Bursts of callers (several dashboards polling /health/ecosystem, the
+        background loop) share one probe round: a result younger than
+        RESULT_CACHE_TTL_SECONDS is returned as is, and callers arriving
+        while a check is running wait for that check instead of starting
+        another.
+
+        The returned object (including its components and connections
+        dicts) is the same instance for every caller in that window, so it
+        is read-only: callers that need to add fields must copy first, as
+        AlertManager does for transition details.
+
+        Returns:
+            EcosystemHealth object with aggregated status (shared; do not modify)
+        """
+        cached = self._cached_health
+        if cached is not None and time.monotonic() - cached[0] < self.RESULT_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._run_health_check())
+            self._inflight.add_done_callback(self._finish_health_check)
+
+        # Shielded so a cancelled caller (e.g. a dropped request) does not
+        # cancel the check the other callers are waiting on
+        return await asyncio.shield(self._inflight)
+
+    def _finish_health_check(self, task: asyncio.Task) -> None:
+        """Cache a completed check's result and clear the in-flight task."""
+        self._inflight = None
+        if not task.cancelled() and task.exception() is None:
+            self._cached_health = (time.monotonic(), task.result())
+
+    async def _run_health_check(self) -> EcosystemHealth:
         """
         Perform a complete ecosystem health check.
 
@@ -154,7 +283,7 @@ class EcosystemHealthManager:
         # Check all components in parallel
         components = await self._check_all_components()
         result.components = {
-            comp.name.lower().replace("-", "_"): self._component_to_dict(comp)
+            comp.key: self._component_to_dict(comp)
             for comp in components
         }
 
@@ -164,11 +293,8 @@ class EcosystemHealthManager:
             conn.name: self._connection_to_dict(conn) for conn in connections
         }
 
-        # Calculate summary
-        result.summary = self._calculate_summary(components)
-
-        # Determine overall status
-        result.status = self._determine_overall_status(components, connections)
+        # Calculate summary and overall status
+        result.summary, result.status = self._aggregate_status(components, connections)
 
         # Add metadata
         check_duration_ms = (time.monotonic() - start_time) * 1000
@@ -179,8 +305,9 @@ class EcosystemHealthManager:
         }
 
         self._log.info(
-            f"✅ Ecosystem health check complete: {result.status.value} "
-            f"({check_duration_ms:.0f}ms)"
+            "✅ Ecosystem health check complete: %s (%.0fms)",
+            result.status.value,
+            check_duration_ms,
         )
 
         return result
@@ -189,116 +316,132 @@ class EcosystemHealthManager:
         """
         Check health of all configured components in parallel.
 
+        Disabled components are resolved immediately; only enabled ones are
+        checked over the network, at most MAX_CONCURRENT_CHECKS at a time.
+
         Returns:
-            List of ComponentHealth objects
+            List of ComponentHealth objects (in configuration order)
         """
-        components_config = self._config.get_all_components()
-        tasks = []
-
-        for key, config in components_config.items():
-            # Skip non-component entries (like "description", "defaults", etc.)
-            if not isinstance(config, dict):
-                continue
-
-            # Skip metadata keys that might be dicts but aren't components
-            if key in ("description", "defaults", "validation", "_metadata"):
-                continue
+        results: List[Optional[ComponentHealth]] = []
+        pending: List[Tuple[int, asyncio.Task]] = []
+
+        # _check_component never raises, so one failed probe cannot cancel
+        # its siblings in the task group
+        async with asyncio.TaskGroup() as tg:
+            for key, name, health_url, enabled in self._components:
+                if not enabled:
+                    # Return a disabled status immediately
+                    results.append(self._create_disabled_component(key, name, health_url))
+                else:
+                    pending.append((
+                        len(results),
+                        tg.create_task(
+                            self._check_component_bounded(key, name, health_url)
+                        ),
+                    ))
+                    results.append(None)
 
-            # Check if component is enabled
-            enabled = config.get("enabled", config.get("defaults", {}).get("enabled", True))
-            if not enabled:
-                # Return a disabled status immediately
-                tasks.append(self._create_disabled_component(key, config))
-            else:
-                tasks.append(self._check_component(key, config))
+        for index, task in pending:
+            results[index] = task.result()
 
-        return await asyncio.gather(*tasks)
+        return results
 
-    async def _create_disabled_component(
-        self, key: str, config: Dict[str, Any]
+    def _create_disabled_component(
+        self, key: str, name: str, health_url: str
     ) -> ComponentHealth:
         """Create a ComponentHealth for a disabled component."""
-        name = config.get("name", key)
-        health_url = config.get("health_url", config.get("defaults", {}).get("health_url", ""))
-
         return ComponentHealth(
+            key=key,
             name=name,
             status=ComponentStatus.DISABLED,
             endpoint=health_url,
         )
 
+    async def _check_component_bounded(
+        self, key: str, name: str, health_url: str
+    ) -> ComponentHealth:
+        """Check a component while holding a slot of the check semaphore."""
+        async with self._check_semaphore:
+            return await self._check_component(key, name, health_url)
+
     async def _check_component(
-        self, key: str, config: Dict[str, Any]
+        self, key: str, name: str, health_url: str
     ) -> ComponentHealth:
         """
         Check the health of a single component.
 
         Args:
             key: Component key (e.g., "ash_bot")
-            config: Component configuration dictionary
+            name: Component display name
+            health_url: Component health endpoint URL
 
         Returns:
             ComponentHealth object
         """
-        name = config.get("name", key)
-        health_url = config.get("health_url", config.get("defaults", {}).get("health_url", ""))
-
-        self._log.debug(f"🔍 Checking {name} at {health_url}")
+        # Lazy %-style: the message is only built when DEBUG is enabled
+        self._log.debug("🔍 Checking %s at %s", name, health_url)
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
-                start = time.monotonic()
-                response = await client.get(health_url)
-                response_time_ms = (time.monotonic() - start) * 1000
-
-                if response.status_code == 200:
-                    # Parse response for additional details
-                    try:
-                        data = response.json()
-                    except Exception:
-                        data = {}
-
-                    # Determine status based on response and latency
-                    status = self._determine_component_status(response_time_ms, data)
-
-                    return ComponentHealth(
-                        name=name,
-                        status=status,
-                        endpoint=health_url,
-                        response_time_ms=round(response_time_ms, 2),
-                        version=data.get("version"),
-                        uptime_seconds=data.get("uptime_seconds"),
-                        details=data,
-                    )
-                else:
-                    # Non-200 response
-                    return ComponentHealth(
-                        name=name,
-                        status=ComponentStatus.UNHEALTHY,
-                        endpoint=health_url,
-                        response_time_ms=round(response_time_ms, 2),
-                        error=f"HTTP {response.status_code}",
-                    )
+            start = time.monotonic()
+            response = await self._get_client().get(
+                health_url, timeout=self._timeout_seconds
+            )
+            response_time_ms = (time.monotonic() - start) * 1000
+
+            if response.status_code == 200:
+                # Parse response for additional details (the body is already
+                # read; orjson skips httpx's charset detection and stdlib json)
+                try:
+                    data = orjson.loads(response.content) if response.content else {}
+                except orjson.JSONDecodeError:
+                    data = {}
+
+                # Determine status based on response and latency
+                status = self._determine_component_status(response_time_ms, data)
+
+                return ComponentHealth(
+                    key=key,
+                    name=name,
+                    status=status,
+                    endpoint=health_url,
+                    response_time_ms=round(response_time_ms, 2),
+                    version=data.get("version"),
+                    uptime_seconds=data.get("uptime_seconds"),
+                    details=data,
+                )
+            else:
+                # Non-200 response
+                return ComponentHealth(
+                    key=key,
+                    name=name,
+                    status=ComponentStatus.UNHEALTHY,
+                    endpoint=health_url,
+                    response_time_ms=round(response_time_ms, 2),
+                    error=f"HTTP {response.status_code}",
+                )
 
         except httpx.TimeoutException:
-            self._log.warning(f"⏱️  Timeout checking {name}")
+            self._log.warning("⏱️  Timeout checking %s", name)
             return ComponentHealth(
+                key=key,
                 name=name,
                 status=ComponentStatus.UNREACHABLE,
                 endpoint=health_url,
                 error="Connection timeout",
             )
         except httpx.ConnectError as e:
-            self._log.warning(f"🔌 Connection error for {name}: {e}")
+            self._log.warning("🔌 Connection error for %s: %s", name, e)
             return ComponentHealth(
+                key=key,
                 name=name,
                 status=ComponentStatus.UNREACHABLE,
                 endpoint=health_url,
                 error="Connection refused",
             )
         except Exception as e:
-            self._log.error(f"❌ Error checking {name}: {e}")
+            self._log.error("❌ Error checking %s: %s", name, e)
             return ComponentHealth(
+                key=key,
                 name=name,
                 status=ComponentStatus.UNREACHABLE,
                 endpoint=health_url,
@@ -319,19 +462,15 @@ class EcosystemHealthManager:
             ComponentStatus enum value
         """
         # Check if the component reports its own status
-        reported_status = data.get("status", "").lower()
-        if reported_status == "unhealthy":
-            return ComponentStatus.UNHEALTHY
-        if reported_status == "degraded":
-            return ComponentStatus.DEGRADED
-
-        # Check latency thresholds
-        if response_time_ms > self.LATENCY_CRITICAL_MS:
-            return ComponentStatus.UNHEALTHY
-        if response_time_ms > self.LATENCY_WARNING_MS:
-            return ComponentStatus.DEGRADED
+        reported_status = self._REPORTED_STATUSES.get(data.get("status", "").lower())
+        if reported_status is not None:
+            return reported_status
 
-        return ComponentStatus.HEALTHY
+        # Check latency thresholds (the critical threshold implies the warning one)
+        return self._LATENCY_STATUSES[
+            (response_time_ms > self.LATENCY_WARNING_MS)
+            + (response_time_ms > self.LATENCY_CRITICAL_MS)
+        ]
 
     async def _check_all_connections(
         self, components: List[ComponentHealth]
@@ -345,15 +484,12 @@ class EcosystemHealthManager:
         Returns:
             List of ConnectionHealth objects
         """
-        connection_checks = self._config.get_connection_checks()
         results = []
 
         # Build a lookup of component health by key
-        component_lookup = {
-            comp.name.lower().replace("-", "_"): comp for comp in components
-        }
+        component_lookup = {comp.key: comp for comp in components}
 
-        for check in connection_checks:
+        for check in self._connection_checks:
             source_key = check.get("source", "")
             target_key = check.get("target", "")
             check_name = check.get("name", f"{source_key} -> {target_key}")
@@ -417,15 +553,22 @@ class EcosystemHealthManager:
 
         return results
 
-    def _calculate_summary(self, components: List[ComponentHealth]) -> Dict[str, int]:
+    def _aggregate_status(
+        self, components: List[ComponentHealth], connections: List[ConnectionHealth]
+    ) -> Tuple[Dict[str, int], ComponentStatus]:
         """
-        Calculate summary counts by status.
+        Count components by status and determine the overall ecosystem status.
+
+        Both come from a single pass over the components: the per-status
+        counts already say whether any component is unreachable, unhealthy
+        or degraded.
 
         Args:
             components: List of component health results
+            connections: List of connection health results
 
         Returns:
-            Dictionary with counts per status
+            Tuple of (counts per status, overall ecosystem status)
         """
         summary = {
             "healthy": 0,
@@ -438,28 +581,6 @@ class EcosystemHealthManager:
         for comp in components:
             summary[comp.status.value] += 1
 
-        return summary
-
-    def _determine_overall_status(
-        self, components: List[ComponentHealth], connections: List[ConnectionHealth]
-    ) -> ComponentStatus:
-        """
-        Determine the overall ecosystem status.
-
-        Args:
-            components: List of component health results
-            connections: List of connection health results
-
-        Returns:
-            Overall ecosystem status
-        """
-        # Check for any unreachable or unhealthy components
-        has_unreachable = any(
-            c.status == ComponentStatus.UNREACHABLE for c in components
-        )
-        has_unhealthy = any(c.status == ComponentStatus.UNHEALTHY for c in components)
-        has_degraded = any(c.status == ComponentStatus.DEGRADED for c in components)
-
         # Check for critical connection failures
         critical_connection_failed = any(
             conn.critical
@@ -467,12 +588,12 @@ class EcosystemHealthManager:
             for conn in connections
         )
 
-        if has_unreachable or has_unhealthy or critical_connection_failed:
-            return ComponentStatus.UNHEALTHY
-        if has_degraded:
-            return ComponentStatus.DEGRADED
+        if summary["unreachable"] or summary["unhealthy"] or critical_connection_failed:
+            return summary, ComponentStatus.UNHEALTHY
+        if summary["degraded"]:
+            return summary, ComponentStatus.DEGRADED
 
-        return ComponentStatus.HEALTHY
+        return summary, ComponentStatus.HEALTHY
 
     def _component_to_dict(self, comp: ComponentHealth) -> Dict[str, Any]:
         """Convert ComponentHealth to dictionary."""
@@ -509,11 +630,31 @@ class EcosystemHealthManager:
 
 
 # =============================================================================
-# Factory Function (Clean Architecture Rule #1)
+# Factory Functions (Clean Architecture Rule #1)
 # =============================================================================
+def create_health_check_client(timeout_seconds: float) -> httpx.AsyncClient:
+    """
+    Factory function to create the pooled HTTP client used for health checks.
+
+    Args:
+        timeout_seconds: Default request timeout in seconds
+
+    Returns:
+        httpx.AsyncClient sized for ecosystem health checks
+    """
+    return httpx.AsyncClient(
+        timeout=timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=EcosystemHealthManager.MAX_CONNECTIONS,
+            max_keepalive_connections=EcosystemHealthManager.MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+
 def create_ecosystem_health_manager(
     config_manager: ConfigManager,
     logger: LoggingConfigManager,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> EcosystemHealthManager:
     """
     Factory function to create an EcosystemHealthManager instance.
@@ -521,19 +662,25 @@ def create_ecosystem_health_manager(
     Args:
         config_manager: Configuration manager instance
         logger: Logging manager instance
+        client: Optional shared HTTP client (created lazily if not provided)
 
     Returns:
         Configured EcosystemHealthManager instance
+
+    Note:
+        Call close() on shutdown to release the HTTP client it created.
     """
     return EcosystemHealthManager(
         config_manager=config_manager,
         logger=logger,
+        client=client,
     )
 
 
 __all__ = [
     "EcosystemHealthManager",
     "create_ecosystem_health_manager",
+    "create_health_check_client",
     "ComponentStatus",
     "ComponentHealth",
     "ConnectionHealth",
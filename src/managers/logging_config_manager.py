@@ -31,11 +31,16 @@ RESPONSIBILITIES:
 """
 
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
 
 # Module version
 __version__ = "v5.0-6-1.1-1"
@@ -141,49 +146,80 @@ class HumanReadableFormatter(logging.Formatter):
         self.use_colors = use_colors
         self.use_symbols = use_symbols
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format the log record with colors and alignment."""
-        # Get color for this level
-        level_color = self.LEVEL_COLORS.get(record.levelno, Colors.RESET)
-        symbol = self.LEVEL_SYMBOLS.get(record.levelno, "") if self.use_symbols else ""
-
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime(self.datefmt)
-
-        # Pad level name for alignment
+        # (whole second, rendered "[timestamp] " prefix) of the last record;
+        # records in the same second reuse it. One tuple so the pair is
+        # swapped atomically.
+        self._timestamp_cache = (-1, "")
+        self._timestamp_template = (
+            f"{Colors.TIMESTAMP}[{{}}]{Colors.RESET} " if use_colors else "[{}] "
+        )
+
+        # Static pieces of every line, with colors baked in once:
+        # levelno -> (text before logger name, text before message, line end)
+        self._level_parts: Dict[int, Tuple[str, str, str]] = {}
+        # logger name -> truncated and padded display form
+        self._logger_names: Dict[str, str] = {}
+
+    def _build_level_parts(self, record: logging.LogRecord) -> Tuple[str, str, str]:
+        """Build (and cache) the static line pieces for a record's level."""
         level_name = record.levelname.ljust(8)
+        symbol = self.LEVEL_SYMBOLS.get(record.levelno, "") if self.use_symbols else ""
 
-        # Truncate logger name if too long
-        logger_name = record.name
-        if len(logger_name) > 25:
-            logger_name = "..." + logger_name[-22:]
-        logger_name = logger_name.ljust(25)
-
-        # Get the message
-        message = record.getMessage()
-
-        # Build formatted output
         if self.use_colors:
-            formatted = (
-                f"{Colors.TIMESTAMP}[{timestamp}]{Colors.RESET} "
+            level_color = self.LEVEL_COLORS.get(record.levelno, Colors.RESET)
+            parts = (
                 f"{level_color}{level_name}{Colors.RESET} "
-                f"{Colors.DIM}|{Colors.RESET} "
-                f"{Colors.LOGGER_NAME}{logger_name}{Colors.RESET} "
-                f"{Colors.DIM}|{Colors.RESET} "
-                f"{symbol} {level_color}{message}{Colors.RESET}"
+                f"{Colors.DIM}|{Colors.RESET} {Colors.LOGGER_NAME}",
+                f"{Colors.RESET} {Colors.DIM}|{Colors.RESET} {symbol} {level_color}",
+                Colors.RESET,
             )
         else:
-            formatted = (
-                f"[{timestamp}] {level_name} | {logger_name} | {symbol} {message}"
+            parts = (f"{level_name} | ", f" | {symbol} ", "")
+
+        self._level_parts[record.levelno] = parts
+        return parts
+
+    def _format_logger_name(self, name: str) -> str:
+        """Truncate and pad a logger name (cached; logger names are few)."""
+        display = name if len(name) <= 25 else "..." + name[-22:]
+        display = display.ljust(25)
+        self._logger_names[name] = display
+        return display
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the log record with colors and alignment."""
+        # Render the timestamp prefix (once per second)
+        second = int(record.created)
+        cached_second, stamp = self._timestamp_cache
+        if second != cached_second:
+            stamp = self._timestamp_template.format(
+                time.strftime(self.datefmt, time.localtime(second))
             )
+            self._timestamp_cache = (second, stamp)
 
-        # Add exception info if present
+        level_parts = self._level_parts.get(record.levelno)
+        if level_parts is None:
+            level_parts = self._build_level_parts(record)
+        before_name, before_message, line_end = level_parts
+
+        logger_name = self._logger_names.get(record.name)
+        if logger_name is None:
+            logger_name = self._format_logger_name(record.name)
+
+        formatted = (
+            f"{stamp}{before_name}{logger_name}{before_message}"
+            f"{record.getMessage()}{line_end}"
+        )
+
+        # Add exception info if present (the traceback text is cached on the
+        # record, so it is formatted once for all handlers)
         if record.exc_info:
-            exc_text = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             if self.use_colors:
-                formatted += f"\n{Colors.ERROR}{exc_text}{Colors.RESET}"
+                formatted += f"\n{Colors.ERROR}{record.exc_text}{Colors.RESET}"
             else:
-                formatted += f"\n{exc_text}"
+                formatted += f"\n{record.exc_text}"
 
         return formatted
 
@@ -194,12 +230,25 @@ class HumanReadableFormatter(logging.Formatter):
 class JsonFormatter(logging.Formatter):
     """JSON formatter for structured logging in production."""
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize the JSON formatter."""
+        super().__init__(*args, **kwargs)
+
+        # (whole second, ISO timestamp to the second) of the last record
+        self._timestamp_cache = (-1, "")
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON."""
-        import json
+        # ISO timestamp to the second is formatted once per second; the
+        # milliseconds come from the record
+        second = int(record.created)
+        cached_second, timestamp = self._timestamp_cache
+        if second != cached_second:
+            timestamp = datetime.fromtimestamp(second).isoformat()
+            self._timestamp_cache = (second, timestamp)
 
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": f"{timestamp}.{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -209,9 +258,42 @@ class JsonFormatter(logging.Formatter):
         }
 
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            # Cached on the record (like logging.Formatter) so every handler
+            # that emits it reuses one formatted traceback
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
+
+        return orjson.dumps(log_data).decode()
+
+
+# =============================================================================
+# Access Log Filter for Health Probes
+# =============================================================================
+class ProbeAccessFilter(logging.Filter):
+    """
+    Drops uvicorn access-log records for health probe requests.
+
+    Docker and Kubernetes hit the probe endpoints every few seconds (and
+    Prometheus scrapes /prometheus); logging each request adds noise and
+    formatting cost without telling us anything. Requests to every other
+    path are still logged.
+    """
+
+    PROBE_PATHS = frozenset(
+        {"/health", "/healthz", "/health/ready", "/readyz", "/prometheus"}
+    )
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False for access records whose path is a probe endpoint."""
+        # uvicorn.access args: (client_addr, method, path, http_version, status)
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3:
+            return args[2] not in self.PROBE_PATHS
+        return True
 
-        return json.dumps(log_data)
+
+_PROBE_ACCESS_FILTER = ProbeAccessFilter()
 
 
 # =============================================================================
@@ -225,7 +307,7 @@ class LoggingConfigManager:
         - Colorized console output (human format) per Charter v5.2 Rule #9
         - JSON format for production log aggregation
         - Custom SUCCESS level for positive confirmations
-        - File logging with JSON format
+        - File logging with JSON format (written from a background thread)
         - Per-module logger creation
 
     Example:
@@ -260,6 +342,14 @@ class LoggingConfigManager:
         self.app_name = app_name
         self._configured_loggers: Dict[str, logging.Logger] = {}
 
+        # Handlers we own (kept so reconfigure() can update them in place)
+        self._console_handler: Optional[logging.StreamHandler] = None
+        self._file_handler: Optional[logging.FileHandler] = None
+        # File output goes through a queue: the logging call only enqueues,
+        # and the listener thread does the blocking disk writes
+        self._file_queue_handler: Optional[logging.handlers.QueueHandler] = None
+        self._file_listener: Optional[logging.handlers.QueueListener] = None
+
         # Configure the root logger
         self._configure_logging()
 
@@ -267,55 +357,135 @@ class LoggingConfigManager:
         """Configure the logging system."""
         # Get the root logger for our application
         root_logger = logging.getLogger(self.app_name)
-        root_logger.setLevel(self.level)
 
         # Remove any existing handlers
         root_logger.handlers.clear()
 
-        # Select formatter based on format setting
-        if self.log_format == "json":
-            formatter = JsonFormatter()
-        else:
-            # Check for forced color output (useful for Docker containers)
-            # Set FORCE_COLOR=1 in environment to enable colors without TTY
-            force_color = os.environ.get("FORCE_COLOR", "").lower() in (
-                "1",
-                "true",
-                "yes",
-            )
-            use_colors = force_color or (
-                hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
-            )
-            formatter = HumanReadableFormatter(use_colors=use_colors, use_symbols=True)
-
-        # Add console handler if enabled
-        if self.console_enabled:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(self.level)
-            console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
-
-        # Add file handler if configured
-        if self.log_file:
-            # Ensure the log directory exists
-            log_path = Path(self.log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-
-            file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
-            file_handler.setLevel(logging.DEBUG)
-            # Always use JSON for file logging (easier to parse)
-            file_handler.setFormatter(JsonFormatter())
-            root_logger.addHandler(file_handler)
+        self._apply_handlers(root_logger)
 
         # Prevent propagation to avoid duplicate logs
         root_logger.propagate = False
 
+    def _create_formatter(self) -> logging.Formatter:
+        """Create the console formatter for the current format setting."""
+        if self.log_format == "json":
+            return JsonFormatter()
+
+        # Check for forced color output (useful for Docker containers)
+        # Set FORCE_COLOR=1 in environment to enable colors without TTY
+        force_color = os.environ.get("FORCE_COLOR", "").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        use_colors = force_color or (
+            hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+        )
+        return HumanReadableFormatter(use_colors=use_colors, use_symbols=True)
+
+    def _apply_handlers(self, root_logger: logging.Logger) -> None:
+        """
+        Bring the handler chain in line with the current settings.
+
+        Existing handlers are updated in place; a handler is only created
+        or removed when its output is switched on or off (or the log file
+        path changes).
+        """
+        root_logger.setLevel(self.level)
+
+        # Console handler
+        if self.console_enabled:
+            if self._console_handler is None:
+                self._console_handler = logging.StreamHandler(sys.stdout)
+                root_logger.addHandler(self._console_handler)
+            self._console_handler.setLevel(self.level)
+            self._console_handler.setFormatter(self._create_formatter())
+        elif self._console_handler is not None:
+            root_logger.removeHandler(self._console_handler)
+            self._console_handler = None
+
+        # File handler (reopened only when the path changes)
+        current_file = self._file_handler.baseFilename if self._file_handler else None
+        wanted_file = str(Path(self.log_file).resolve()) if self.log_file else None
+        if current_file != wanted_file:
+            self._close_file_handler(root_logger)
+
+            if self.log_file:
+                # Ensure the log directory exists
+                log_path = Path(self.log_file)
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Records are rendered to JSON (always JSON for file logging,
+                # easier to parse) by the queue handler before enqueueing, so
+                # exception text survives QueueHandler.prepare(); the file
+                # handler writes the finished line as is
+                self._file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
+                self._file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+                self._file_queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+                self._file_queue_handler.setLevel(logging.DEBUG)
+                self._file_queue_handler.setFormatter(JsonFormatter())
+
+                self._file_listener = logging.handlers.QueueListener(
+                    self._file_queue_handler.queue, self._file_handler
+                )
+                self._file_listener.start()
+                root_logger.addHandler(self._file_queue_handler)
+
         # Also configure uvicorn loggers to use our format
         for logger_name in ["uvicorn", "uvicorn.access", "uvicorn.error"]:
             uvicorn_logger = logging.getLogger(logger_name)
             uvicorn_logger.handlers.clear()
-            if self.console_enabled:
-                uvicorn_logger.addHandler(console_handler)
+            if self._console_handler is not None:
+                uvicorn_logger.addHandler(self._console_handler)
+
+        # Keep health probes out of the access log (addFilter ignores repeats)
+        logging.getLogger("uvicorn.access").addFilter(_PROBE_ACCESS_FILTER)
+
+    def _close_file_handler(self, root_logger: logging.Logger) -> None:
+        """Detach file logging, flush queued records, and close the file."""
+        if self._file_queue_handler is not None:
+            root_logger.removeHandler(self._file_queue_handler)
+            self._file_queue_handler = None
+
+        if self._file_listener is not None:
+            # stop() writes out everything already queued before returning
+            self._file_listener.stop()
+            self._file_listener = None
+
+        if self._file_handler is not None:
+            self._file_handler.close()
+            self._file_handler = None
+
+    def close(self) -> None:
+        """Flush and close file logging (call once on shutdown)."""
+        self._close_file_handler(logging.getLogger(self.app_name))
+
+    def reconfigure(
+        self,
+        level: str = "INFO",
+        log_format: str = "human",
+        log_file: Optional[str] = None,
+        console_enabled: bool = True,
+    ) -> None:
+        """
+        Apply new settings to the existing logging setup.
+
+        Used once configuration is loaded, so startup updates the bootstrap
+        handlers instead of building a second manager and handler chain.
+
+        Args:
+            level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            log_format: Output format ('human' or 'json')
+            log_file: Optional file path for log output
+            console_enabled: Whether to output logs to console
+        """
+        self.level = getattr(logging, level.upper(), logging.INFO)
+        self.log_format = log_format.lower()
+        self.log_file = log_file
+        self.console_enabled = console_enabled
+
+        self._apply_handlers(logging.getLogger(self.app_name))
 
     def get_logger(self, name: str) -> logging.Logger:
         """
@@ -404,5 +574,6 @@ __all__ = [
     "Colors",
     "HumanReadableFormatter",
     "JsonFormatter",
+    "ProbeAccessFilter",
     "SUCCESS_LEVEL",
 ]
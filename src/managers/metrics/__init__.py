@@ -24,6 +24,7 @@ Repository: https://github.com/the-alphabet-cartel/ash
 from src.managers.metrics.database import (
     # Data classes
     HealthSnapshot,
+    SnapshotBucket,
     Incident,
     DailyAggregate,
     UptimeMetrics,
@@ -46,6 +47,7 @@ from src.managers.metrics.metrics_manager import (
 __all__ = [
     # Data classes
     "HealthSnapshot",
+    "SnapshotBucket",
     "Incident",
     "DailyAggregate",
     "UptimeMetrics",
@@ -34,11 +34,12 @@ MIGRATION GUIDELINES:
 
 import json
 import aiosqlite
+import orjson
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, date, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from src.managers.logging_config_manager import LoggingConfigManager
 
@@ -72,6 +73,24 @@ class HealthSnapshot:
         return json.loads(self.connections_json) if self.connections_json else {}
 
 
+@dataclass
+class SnapshotBucket:
+    """
+    Last health snapshot within one downsampling interval.
+
+    Produced by the database when downsampling history for charts; only the
+    fields the history view needs are loaded.
+    """
+    timestamp: datetime  # Start of the bucket
+    ecosystem_status: str
+    components_json: str  # JSON blob as TEXT
+
+    @property
+    def components(self) -> Dict[str, Any]:
+        """Parse components JSON into dict (orjson: one parse per bucket row)."""
+        return orjson.loads(self.components_json) if self.components_json else {}
+
+
 @dataclass
 class Incident:
     """
@@ -223,9 +242,12 @@ CREATE TABLE IF NOT EXISTS incidents (
 );
 
 CREATE INDEX IF NOT EXISTS idx_incidents_timestamp ON incidents(timestamp);
-CREATE INDEX IF NOT EXISTS idx_incidents_entity ON incidents(entity_name);
 CREATE INDEX IF NOT EXISTS idx_incidents_resolved ON incidents(resolved_at);
 CREATE INDEX IF NOT EXISTS idx_incidents_entity_type ON incidents(entity_type);
+-- Serves "incidents for one entity, newest first" as a bounded range scan
+-- and supersedes the v1 single-column idx_incidents_entity
+CREATE INDEX IF NOT EXISTS idx_incidents_entity_timestamp ON incidents(entity_name, timestamp);
+DROP INDEX IF EXISTS idx_incidents_entity;
 
 -- Daily aggregates (for fast uptime queries)
 CREATE TABLE IF NOT EXISTS daily_aggregates (
@@ -252,7 +274,9 @@ CREATE TABLE IF NOT EXISTS schema_version (
 );
 """
 
-CURRENT_SCHEMA_VERSION = 1
+# Every statement in SCHEMA_SQL is idempotent, so upgrading an older database
+# is just re-running it (v2 added idx_incidents_entity_timestamp)
+CURRENT_SCHEMA_VERSION = 2
 
 
 # =============================================================================
@@ -315,6 +339,56 @@ class MetricsDatabaseInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_downsampled_snapshots(
+        self,
+        start: datetime,
+        end: datetime,
+        interval_seconds: int,
+    ) -> AsyncIterator[SnapshotBucket]:
+        """
+        Stream the last snapshot in each fixed-size interval of a time range.
+
+        Buckets are aligned to the Unix epoch, so intervals that divide an
+        hour line up with clock minutes/hours. Rows are yielded as they are
+        read from the database rather than materialized as a list.
+
+        Args:
+            start: Start of time range (inclusive)
+            end: End of time range (inclusive)
+            interval_seconds: Bucket size in seconds
+
+        Yields:
+            SnapshotBuckets, ordered by bucket start ascending
+        """
+        ...
+
+    async def get_downsampled_snapshots(
+        self,
+        start: datetime,
+        end: datetime,
+        interval_seconds: int,
+    ) -> List[SnapshotBucket]:
+        """
+        Get the last snapshot in each fixed-size interval of a time range.
+
+        Collects iter_downsampled_snapshots() into a list.
+
+        Args:
+            start: Start of time range (inclusive)
+            end: End of time range (inclusive)
+            interval_seconds: Bucket size in seconds
+
+        Returns:
+            List of SnapshotBuckets, ordered by bucket start ascending
+        """
+        return [
+            bucket
+            async for bucket in self.iter_downsampled_snapshots(
+                start, end, interval_seconds
+            )
+        ]
+
     @abstractmethod
     async def record_incident(self, incident: Incident) -> int:
         """
@@ -358,6 +432,7 @@ class MetricsDatabaseInterface(ABC):
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
         limit: int = 100,
+        before: Optional[Tuple[datetime, int]] = None,
     ) -> List[Incident]:
         """
         Retrieve incident history.
@@ -368,9 +443,11 @@ class MetricsDatabaseInterface(ABC):
             start: Start of time range (optional)
             end: End of time range (optional)
             limit: Maximum number of incidents to return
+            before: Keyset cursor (timestamp, id) of the last incident on the
+                previous page; only older incidents are returned (optional)
             
         Returns:
-            List of Incidents, ordered by timestamp descending
+            List of Incidents, ordered by timestamp then id descending
         """
         ...
 
@@ -452,6 +529,19 @@ class MetricsDatabaseInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_snapshot_counts(self, since: datetime) -> Tuple[int, int]:
+        """
+        Get the total snapshot count and the count since a point in time.
+
+        Args:
+            since: Count snapshots at or after this time for the second value
+
+        Returns:
+            Tuple of (total snapshots, snapshots since ``since``)
+        """
+        ...
+
     @abstractmethod
     async def close(self) -> None:
         """Close database connection."""
@@ -579,7 +669,7 @@ class SQLiteMetricsDatabase(MetricsDatabaseInterface):
                 (
                     CURRENT_SCHEMA_VERSION,
                     self._now_iso(),
-                    "Initial schema with snapshots, incidents, and daily_aggregates",
+                    "Snapshots, incidents, and daily_aggregates with composite incident index",
                 ),
             )
             await conn.commit()
@@ -680,6 +770,54 @@ class SQLiteMetricsDatabase(MetricsDatabaseInterface):
             for row in rows
         ]
 
+    async def iter_downsampled_snapshots(
+        self,
+        start: datetime,
+        end: datetime,
+        interval_seconds: int,
+    ) -> AsyncIterator[SnapshotBucket]:
+        """
+        Stream the last snapshot in each interval, grouped in SQL.
+
+        Migration note: strftime('%s', ...) is SQLite's epoch conversion;
+        PostgreSQL equivalent: EXTRACT(EPOCH FROM timestamp::timestamptz).
+        ROW_NUMBER() is standard SQL.
+        """
+        conn = await self._get_connection()
+
+        async with conn.execute(
+            """
+            SELECT bucket, ecosystem_status, components_json
+            FROM (
+                SELECT
+                    (CAST(strftime('%s', timestamp) AS INTEGER) / ?) * ? AS bucket,
+                    ecosystem_status,
+                    components_json,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY CAST(strftime('%s', timestamp) AS INTEGER) / ?
+                        ORDER BY timestamp DESC
+                    ) AS row_num
+                FROM health_snapshots
+                WHERE timestamp >= ? AND timestamp <= ?
+            )
+            WHERE row_num = 1
+            ORDER BY bucket ASC
+            """,
+            (
+                interval_seconds,
+                interval_seconds,
+                interval_seconds,
+                self._datetime_to_iso(start),
+                self._datetime_to_iso(end),
+            ),
+        ) as cursor:
+            async for row in cursor:
+                yield SnapshotBucket(
+                    timestamp=datetime.fromtimestamp(row[0], timezone.utc),
+                    ecosystem_status=row[1],
+                    components_json=row[2],
+                )
+
     async def record_incident(self, incident: Incident) -> int:
         """Record a new incident."""
         conn = await self._get_connection()
@@ -758,6 +896,7 @@ class SQLiteMetricsDatabase(MetricsDatabaseInterface):
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
         limit: int = 100,
+        before: Optional[Tuple[datetime, int]] = None,
     ) -> List[Incident]:
         """Retrieve incident history."""
         conn = await self._get_connection()
@@ -781,6 +920,12 @@ class SQLiteMetricsDatabase(MetricsDatabaseInterface):
         if end is not None:
             conditions.append("timestamp <= ?")
             params.append(self._datetime_to_iso(end))
+
+        # Keyset pagination: id breaks ties between same-second timestamps
+        if before is not None:
+            before_iso = self._datetime_to_iso(before[0])
+            conditions.append("(timestamp < ? OR (timestamp = ? AND id < ?))")
+            params.extend((before_iso, before_iso, before[1]))
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
         params.append(limit)
@@ -791,7 +936,7 @@ class SQLiteMetricsDatabase(MetricsDatabaseInterface):
                    error_message, duration_seconds, resolved_at, created_at
             FROM incidents
             WHERE {where_clause}
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, id DESC
             LIMIT ?
             """,
             params,
@@ -1000,6 +1145,21 @@ class SQLiteMetricsDatabase(MetricsDatabaseInterface):
         row = await cursor.fetchone()
         return row[0] if row else 0
 
+    async def get_snapshot_counts(self, since: datetime) -> Tuple[int, int]:
+        """Get total and recent snapshot counts in a single scan."""
+        conn = await self._get_connection()
+
+        cursor = await conn.execute(
+            """
+            SELECT COUNT(*),
+                   COALESCE(SUM(CASE WHEN timestamp >= ? THEN 1 ELSE 0 END), 0)
+            FROM health_snapshots
+            """,
+            (self._datetime_to_iso(since),),
+        )
+        row = await cursor.fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
     async def close(self) -> None:
         """Close database connection."""
         if self._connection is not None:
@@ -1034,6 +1194,7 @@ def create_metrics_database(
 __all__ = [
     # Data classes
     "HealthSnapshot",
+    "SnapshotBucket",
     "Incident",
     "DailyAggregate",
     "UptimeMetrics",
@@ -27,9 +27,10 @@ PURPOSE:
 """
 
 import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, date, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.managers.config_manager import ConfigManager
 from src.managers.logging_config_manager import LoggingConfigManager
@@ -79,8 +80,17 @@ class MetricsManager:
         - Uptime calculation from aggregates + raw snapshots
         - Daily aggregation for fast queries
         - Configurable retention cleanup
+        - Short-lived uptime result cache for dashboard polling
     """
 
+    # Uptime results are reused for this long (dashboards poll every few
+    # seconds, the numbers only move meaningfully about once a minute)
+    UPTIME_CACHE_TTL_SECONDS = 30.0
+    UPTIME_CACHE_MAX_ENTRIES = 64
+
+    # Snapshot counts for /metrics/stats are reused for this long
+    SNAPSHOT_COUNTS_CACHE_TTL_SECONDS = 15.0
+
     def __init__(
         self,
         database: MetricsDatabaseInterface,
@@ -106,6 +116,14 @@ class MetricsManager:
         # Track last snapshot timestamp for duration calculations
         self._last_snapshot_time: Optional[datetime] = None
 
+        # (component, days) -> (monotonic time cached, uptime results)
+        self._uptime_cache: Dict[
+            Tuple[Optional[str], int], Tuple[float, Dict[str, UptimeMetrics]]
+        ] = {}
+
+        # (monotonic time cached, (total, last 24h)) for snapshot counts
+        self._snapshot_counts_cache: Optional[Tuple[float, Tuple[int, int]]] = None
+
         self._log_info("✅ MetricsManager initialized")
 
     def _log_info(self, msg: str) -> None:
@@ -410,6 +428,66 @@ class MetricsManager:
         """
         Calculate uptime metrics for a period.
 
+        Results are cached per (component, days) for UPTIME_CACHE_TTL_SECONDS
+        and dropped whenever maintenance rewrites the aggregates. Callers
+        share the returned dictionary and must not modify it.
+
+        Args:
+            component: Filter to specific component (None = all)
+            days: Number of days to calculate (1-90)
+
+        Returns:
+            Dictionary of component name to UptimeMetrics
+        """
+        key = (component, days)
+        now = time.monotonic()
+
+        cached = self._uptime_cache.get(key)
+        if cached is not None and now - cached[0] < self.UPTIME_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        results = await self._calculate_uptime(component, days)
+
+        # Keep the cache bounded (component names come from request input)
+        if len(self._uptime_cache) >= self.UPTIME_CACHE_MAX_ENTRIES:
+            self._uptime_cache.clear()
+        self._uptime_cache[key] = (now, results)
+
+        return results
+
+    async def get_snapshot_counts(self) -> Tuple[int, int]:
+        """
+        Get total snapshot count and the count for the last 24 hours.
+
+        Both come from one query and are cached for
+        SNAPSHOT_COUNTS_CACHE_TTL_SECONDS, since they change by one row per
+        health check.
+
+        Returns:
+            Tuple of (total snapshots, snapshots in the last 24 hours)
+        """
+        now = time.monotonic()
+        cached = self._snapshot_counts_cache
+        if cached is not None and now - cached[0] < self.SNAPSHOT_COUNTS_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        since = datetime.now(timezone.utc) - timedelta(hours=24)
+        counts = await self._db.get_snapshot_counts(since=since)
+        self._snapshot_counts_cache = (now, counts)
+        return counts
+
+    def clear_uptime_cache(self) -> None:
+        """Drop cached uptime results (after aggregates or retention change)."""
+        self._uptime_cache.clear()
+
+    async def _calculate_uptime(
+        self,
+        component: Optional[str],
+        days: int,
+    ) -> Dict[str, UptimeMetrics]:
+        """
+        Calculate uptime metrics for a period (uncached).
+
         Uses daily aggregates for efficiency, with raw snapshots for
         the current (incomplete) day.
 
@@ -584,6 +662,7 @@ class MetricsManager:
         component: Optional[str] = None,
         days: int = 30,
         limit: int = 100,
+        before: Optional[Tuple[datetime, int]] = None,
     ) -> List[Incident]:
         """
         Retrieve incident history.
@@ -592,6 +671,7 @@ class MetricsManager:
             component: Filter to specific component (None = all)
             days: Number of days of history (1-90)
             limit: Maximum number of incidents to return
+            before: Keyset cursor (timestamp, id) from the previous page
 
         Returns:
             List of Incidents, ordered by timestamp descending
@@ -604,6 +684,7 @@ class MetricsManager:
             start=start,
             end=end,
             limit=limit,
+            before=before,
         )
 
     async def aggregate_daily(self, target_date: date) -> None:
@@ -726,6 +807,9 @@ class MetricsManager:
         # Clean up old data
         await self.cleanup_old_data()
 
+        # Aggregates changed - don't serve uptime computed from the old ones
+        self.clear_uptime_cache()
+
         self._log_info("✅ Daily maintenance complete")
 
     async def close(self) -> None:
@@ -0,0 +1,59 @@
+"""
+============================================================================
+Ash: Crisis Detection Ecosystem API
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Listen   → Maintain vigilant presence across all community spaces
+    Detect   → Identify mental health crisis patterns through comprehensive analysis
+    Connect  → Bridge community members to timely support and intervention
+    Protect  → Safeguard our LGBTQIA+ chosen family through early crisis response
+
+============================================================================
+Configuration Manager Tests - Environment Override Type Coercion
+----------------------------------------------------------------------------
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash
+============================================================================
+"""
+
+import os
+import unittest
+from unittest import mock
+
+from src.managers.config_manager import ConfigManager
+
+
+class EnvCoercionTests(unittest.TestCase):
+    """Environment overrides are coerced to the type their setting declares."""
+
+    def _load(self, **env: str) -> ConfigManager:
+        with mock.patch.dict(os.environ, env):
+            return ConfigManager()
+
+    def test_redis_db_one_is_int(self):
+        config = self._load(ASH_REDIS_DB="1")
+        self.assertEqual(config.redis_db, 1)
+        self.assertIs(type(config.redis_db), int)
+
+    def test_redis_port_one_is_int(self):
+        config = self._load(ASH_REDIS_PORT="1")
+        self.assertIs(type(config.redis_port), int)
+
+    def test_workers_one_is_int(self):
+        config = self._load(ASH_WORKERS="1")
+        self.assertEqual(config.server_workers, 1)
+        self.assertIs(type(config.server_workers), int)
+
+    def test_boolean_setting_still_accepts_one(self):
+        config = self._load(ASH_REDIS_ENABLED="1")
+        self.assertIs(config.redis_enabled, True)
+
+    def test_string_setting_is_not_coerced(self):
+        config = self._load(ASH_REDIS_HOST="0")
+        self.assertEqual(config.redis_host, "0")
+
+
+if __name__ == "__main__":
+    unittest.main()